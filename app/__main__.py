@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import os
-from dotenv import load_dotenv
 
 from .config import load_settings
 from .monitor import Monitor
@@ -12,12 +11,21 @@ def setup_logging() -> None:
 
 
 def main() -> None:
+    from dotenv import load_dotenv
+
     load_dotenv()
     # Windows-specific selector policy if available; avoid mutating policy in libraries
     try:
         import os as _os
         if _os.name == "nt":
             asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
+        else:
+            # Optional faster event loop on POSIX
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
     except Exception:
         pass
     setup_logging()
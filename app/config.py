@@ -1,6 +1,7 @@
+import functools
 import os
 from dataclasses import dataclass
-from typing import List
+from typing import FrozenSet, List
 
 
 ALLOWED_GROUPS: List[str] = [
@@ -19,6 +20,8 @@ ALLOWED_GROUPS: List[str] = [
     '@SAVANNAHCALLS',
 ]
 
+_ALLOWED_GROUPS_SET: FrozenSet[str] = frozenset(ALLOWED_GROUPS)
+
 
 def _parse_groups(value: str) -> List[str]:
     """Parse MONITORED_GROUPS env and restrict to ALLOWED_GROUPS.
@@ -29,8 +32,7 @@ def _parse_groups(value: str) -> List[str]:
         return list(ALLOWED_GROUPS)
     parsed = [g.strip() for g in value.split(",") if g.strip()]
     # Restrict to allowed set while preserving order of parsed
-    allowed_set = set(ALLOWED_GROUPS)
-    filtered = [g for g in parsed if g in allowed_set]
+    filtered = [g for g in parsed if g in _ALLOWED_GROUPS_SET]
     # If user provided none of the allowed, fall back to default allowed
     return filtered or list(ALLOWED_GROUPS)
 
@@ -54,22 +56,25 @@ class Settings:
     rpc_timeout_ms: int = 800
 
 
+@functools.lru_cache(maxsize=1)
 def load_settings() -> Settings:
-    api_id = int(os.getenv("API_ID", "0"))
-    api_hash = os.getenv("API_HASH", "")
-    session = os.getenv("SESSION", "memecoin_session")
-    data_dir = os.getenv("DATA_DIR", "data")
+    # Single os.environ snapshot; Settings is built once per process
+    env = os.environ
+    api_id = int(env.get("API_ID", "0"))
+    api_hash = env.get("API_HASH", "")
+    session = env.get("SESSION", "memecoin_session")
+    data_dir = env.get("DATA_DIR", "data")
     session_path = os.path.join(data_dir, session)
-    db_path = os.path.join(data_dir, os.getenv("DB_FILE", "signals.db"))
-    target_group = os.getenv("TARGET_GROUP", "@callbotmemecoin")
-    hot_threshold = int(os.getenv("HOT_THRESHOLD", "4"))
-    hot_ttl_seconds = int(os.getenv("HOT_TTL_SECONDS", "43200"))  # 12h
-    fast_ttl_seconds = int(os.getenv("FAST_TTL_SECONDS", "1800"))  # 30m
-    rc_timeout_ms = int(os.getenv("RC_TIMEOUT_MS", "400"))
-    alert_coalesce_seconds = int(os.getenv("ALERT_COALESCE_SECONDS", "3600"))
-    rpc_url = os.getenv("RPC_URL", "https://api.mainnet-beta.solana.com")
-    rpc_timeout_ms = int(os.getenv("RPC_TIMEOUT_MS", "800"))
-    monitored_groups = _parse_groups(os.getenv("MONITORED_GROUPS", ""))
+    db_path = os.path.join(data_dir, env.get("DB_FILE", "signals.db"))
+    target_group = env.get("TARGET_GROUP", "@callbotmemecoin")
+    hot_threshold = int(env.get("HOT_THRESHOLD", "4"))
+    hot_ttl_seconds = int(env.get("HOT_TTL_SECONDS", "43200"))  # 12h
+    fast_ttl_seconds = int(env.get("FAST_TTL_SECONDS", "1800"))  # 30m
+    rc_timeout_ms = int(env.get("RC_TIMEOUT_MS", "400"))
+    alert_coalesce_seconds = int(env.get("ALERT_COALESCE_SECONDS", "3600"))
+    rpc_url = env.get("RPC_URL", "https://api.mainnet-beta.solana.com")
+    rpc_timeout_ms = int(env.get("RPC_TIMEOUT_MS", "800"))
+    monitored_groups = _parse_groups(env.get("MONITORED_GROUPS", ""))
 
     return Settings(
         api_id=api_id,
@@ -2,21 +2,21 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SignalEvent:
     ts: int
     ca: str
     group_id: int
     group_name: Optional[str]
     kind: str  # "fast" | "slow"
-    ug_fast: Optional[int]
-    ug_slow: Optional[int]
+    unique_groups_fast: Optional[int]
+    unique_groups_slow: Optional[int]
     hot_threshold: int
     sent_message_id: Optional[int]
     extra: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RugcheckEvent:
     ts: int
     ca: str
@@ -27,7 +27,7 @@ class RugcheckEvent:
 
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MentionEvent:
     ts: int
     ca: str
@@ -36,7 +36,7 @@ class MentionEvent:
     message_id: Optional[int]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TradeIntentEvent:
     ts: int
     ca: str
@@ -52,7 +52,7 @@ class TradeIntentEvent:
     rc_upd_short: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OnchainEvent:
     ts: int
     ca: str
@@ -1,11 +1,13 @@
 import asyncio
+import functools
 import logging
 import os
-from typing import List
-
-from telethon import TelegramClient, events
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List
 
 import time
+from cachetools import TTLCache
+
 from .config import Settings
 from .parser import extract_solana_addresses
 from .tracker import HotTracker
@@ -14,18 +16,58 @@ from .recorder import SignalRecorder
 from .events import SignalEvent, RugcheckEvent, MentionEvent, TradeIntentEvent, OnchainEvent
 from .onchain import OnchainAnalyzer
 
+log = logging.getLogger(__name__)
+
 # Import executor bridge for auto-trading
 try:
     from exec.monitor_integration import ExecutorBridge
     EXECUTOR_AVAILABLE = True
 except ImportError:
     EXECUTOR_AVAILABLE = False
-    logging.warning("🤖 Executor not available - auto-trading disabled")
+    log.warning("🤖 Executor not available - auto-trading disabled")
+
+# Concurrent Rugcheck lookups; alerts beyond the queue bound are dropped
+_RC_FETCH_WORKERS = 8
+# Trade intents waiting for the executor; when full the oldest is dropped
+_INTENT_QUEUE_MAX = 256
+# Intents older than this (seconds) are stale and never reach the executor
+_INTENT_MAX_AGE_S = 5
+# Messages longer than this are parsed on the parse pool instead of the loop
+_PARSE_OFFLOAD_MIN_LEN = 1024
 
 
 class Monitor:
+    __slots__ = (
+        "settings",
+        "client",
+        "tracker_fast",
+        "tracker_slow",
+        "rugcheck",
+        "recorder",
+        "onchain",
+        "executor_bridge",
+        "_fast_prefix",
+        "_slow_prefix",
+        "_rec_queue",
+        "_rec_dispatch",
+        "_intent_queue",
+        "_intent_dropped",
+        "_rc_fetch_queue",
+        "_coalesce_seconds",
+        "_any_alerted_at",
+        "_chat_cache",
+        "_parse_pool",
+        "_recent_seen",
+    )
+
     def __init__(self, settings: Settings) -> None:
         self.settings = settings
+        # Alert prefixes only depend on the threshold, which is fixed after startup
+        self._fast_prefix = f"⚡ {settings.hot_threshold}x — "
+        self._slow_prefix = f"🔥 {settings.hot_threshold}x — "
+        # Telethon is imported lazily so config/parser users don't pay for it
+        from telethon import TelegramClient
+
         # Store session file under data directory
         self.client = TelegramClient(settings.session_path, settings.api_id, settings.api_hash)
         self.tracker_fast = HotTracker(settings.fast_ttl_seconds)
@@ -39,341 +81,382 @@ class Monitor:
         if EXECUTOR_AVAILABLE and os.getenv("REDIS_URL"):
             try:
                 self.executor_bridge = ExecutorBridge()
-                logging.info("Auto-trading bridge initialized")
+                log.info("Auto-trading bridge initialized")
             except Exception as e:
                 self.executor_bridge = None
-                logging.warning(f"Auto-trading disabled: {e}")
+                log.warning("Auto-trading disabled: %s", e)
         else:
-            logging.info("Auto-trading disabled: REDIS_URL not set or executor unavailable")
-        # In-process queues so recording never blocks Telegram handler
-        self._signal_queue: asyncio.Queue[SignalEvent] = asyncio.Queue()
-        self._rc_queue: asyncio.Queue[RugcheckEvent] = asyncio.Queue()
-        self._mention_queue: asyncio.Queue[MentionEvent] = asyncio.Queue()
-        self._intent_queue: asyncio.Queue[TradeIntentEvent] = asyncio.Queue()
-        self._onchain_queue: asyncio.Queue[OnchainEvent] = asyncio.Queue()
+            log.info("Auto-trading disabled: REDIS_URL not set or executor unavailable")
+        # One in-process queue of (kind, payload) so recording never blocks the
+        # Telegram handler; every payload is the event dataclass for its table.
+        # Left unbounded: the consumer only hands rows to the recorder, and it
+        # is the recorder's writer queue that is bounded and sheds old rows.
+        self._rec_queue: asyncio.Queue[tuple[str, Any]] = asyncio.Queue()
+        self._rec_dispatch: Dict[str, Callable[[Any], Awaitable[None]]] = {
+            "signal": functools.partial(self.recorder.record_event, "signals"),
+            "rc": functools.partial(self.recorder.record_event, "rugcheck"),
+            "mention": functools.partial(self.recorder.record_event, "mentions"),
+            "intent": functools.partial(self.recorder.record_event, "trade_intents"),
+            "onchain": functools.partial(self.recorder.record_event, "onchain"),
+        }
+        # Trade intents for the executor; sent from their own task so a slow
+        # Redis write never holds up recording
+        self._intent_queue: asyncio.Queue[TradeIntentEvent] = asyncio.Queue(maxsize=_INTENT_QUEUE_MAX)
+        self._intent_dropped = 0
+        # Sent alerts awaiting Rugcheck decoration: (message, ca, ts)
+        self._rc_fetch_queue: asyncio.Queue[tuple[object, str, int]] = asyncio.Queue(maxsize=1024)
         # Coalesce duplicate fast/slow alerts for the same CA within this window (seconds)
         self._coalesce_seconds: int = getattr(settings, "alert_coalesce_seconds", 3600)
-        self._any_alerted_at: dict[str, float] = {}
+        # Entries expire on access, so no periodic sweep is needed
+        self._any_alerted_at: TTLCache = TTLCache(
+            maxsize=100_000, ttl=max(self._coalesce_seconds, settings.hot_ttl_seconds)
+        )
+        # chat_id -> (group_id, group_name); refreshed hourly to pick up renames
+        self._chat_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        # (group_id, ca) pairs handled in the last few seconds; a group re-posting
+        # the same CA adds no unique group, so repeats skip the pipeline
+        self._recent_seen: TTLCache = TTLCache(maxsize=65536, ttl=10)
+        self._parse_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="parse")
 
     async def start(self) -> None:
-        logging.info("🚀 Starting Telegram client…")
+        from telethon import events
+
+        log.info("🚀 Starting Telegram client…")
         await self.client.start()
-        logging.info("✅ Client started. Monitoring groups…")
+        log.info("✅ Client started. Monitoring groups…")
 
-        self.client.add_event_handler(self._on_message, events.NewMessage(chats=self.settings.monitored_groups))
+        # Resolve @usernames to input entities once instead of per event match
+        groups = self.settings.monitored_groups
+        resolved = await asyncio.gather(*(self.client.get_input_entity(g) for g in groups), return_exceptions=True)
+        chats = []
+        for group, entity in zip(groups, resolved):
+            if isinstance(entity, Exception):
+                log.warning("Could not resolve %s: %s", group, entity)
+                continue
+            chats.append(entity)
+        self.client.add_event_handler(self._on_message, events.NewMessage(chats=chats))
         # Background consumers for persistence
         consumers = [
-            asyncio.create_task(self._consume_signals()),
-            asyncio.create_task(self._consume_rugcheck()),
-            asyncio.create_task(self._consume_mentions()),
-            asyncio.create_task(self._consume_intents()),
-            asyncio.create_task(self._consume_onchain()),
+            asyncio.create_task(self._consume_records()),
             asyncio.create_task(self._maintenance_task()),
         ]
+        consumers.extend(asyncio.create_task(self._rc_fetch_worker()) for _ in range(_RC_FETCH_WORKERS))
+        if self.executor_bridge:
+            consumers.append(asyncio.create_task(self._send_intents()))
         try:
             await self.client.run_until_disconnected()
         finally:
             for c in consumers:
                 c.cancel()
+            # Let cancelled tasks unwind before their clients are closed
+            await asyncio.gather(*consumers, return_exceptions=True)
             await self.rugcheck.close()
             try:
                 await self.onchain.close()
             except Exception:
                 pass
+            await self.recorder.close()
+            self._parse_pool.shutdown(wait=False)
 
     async def _maintenance_task(self) -> None:
+        reported_drops = reported_intent_drops = 0
         try:
             while True:
                 await asyncio.sleep(300)
-                self.tracker_fast.clear_expired()
-                self.tracker_slow.clear_expired()
-                # prune coalescing map
                 now = time.time()
-                for ca, ts in list(self._any_alerted_at.items()):
-                    if now - ts > max(self._coalesce_seconds, self.settings.hot_ttl_seconds):
-                        self._any_alerted_at.pop(ca, None)
+                self.tracker_fast.clear_expired(now)
+                self.tracker_slow.clear_expired(now)
+                dropped = self.recorder.dropped
+                if dropped != reported_drops:
+                    log.warning(
+                        "Recorder queue overflowed: %d rows dropped (%d total)",
+                        dropped - reported_drops,
+                        dropped,
+                    )
+                    reported_drops = dropped
+                intent_dropped = self._intent_dropped
+                if intent_dropped != reported_intent_drops:
+                    log.warning(
+                        "Trade intents dropped (queue full or stale): %d (%d total)",
+                        intent_dropped - reported_intent_drops,
+                        intent_dropped,
+                    )
+                    reported_intent_drops = intent_dropped
         except asyncio.CancelledError:
             return
 
     def _signal_message_fast(self, ca: str) -> str:
-        return f"⚡ {self.settings.hot_threshold}x — {ca}"
+        return self._fast_prefix + ca
 
     def _signal_message_slow(self, ca: str) -> str:
-        return f"🔥 {self.settings.hot_threshold}x — {ca}"
+        return self._slow_prefix + ca
 
-    async def _append_rc_and_edit(self, message, ca: str) -> None:
+    async def _rc_fetch_worker(self) -> None:
+        while True:
+            message, ca, ts = await self._rc_fetch_queue.get()
+            try:
+                await self._decorate_and_record(message, ca, ts)
+            finally:
+                self._rc_fetch_queue.task_done()
+
+    async def _fetch_rc_summary(self, ca: str) -> tuple[str, str, str, str]:
+        # RugcheckClient already retries 429/5xx and caches the report, so a
+        # second loop here would only multiply the attempts and the wait
+        try:
+            report = await self.rugcheck.fetch_report(ca)
+        except Exception:
+            report = None
+        return RugcheckClient.summarize(report or {})
+
+    async def _fetch_onchain(self, ca: str) -> dict | None:
         try:
-            # Try a few times in case Rugcheck is rate-limiting (429)
-            attempts = 0
-            score = risk_text = lp_text = upd_short = "pending"
-            while attempts < 4:
-                attempts += 1
-                try:
-                    report = await self.rugcheck.fetch_report(ca)
-                    score, risk_text, lp_text, upd_short = RugcheckClient.summarize(report or {})
-                    # If we got a concrete score (not pending), stop retrying
-                    if score != "pending":
-                        break
-                except Exception:
-                    pass
-                # Back off a bit longer on each retry to respect rate limits
-                await asyncio.sleep(0.7 * attempts)
+            return await self.onchain.analyze(ca)
+        except Exception:
+            return None
 
+    async def _decorate_and_record(self, message, ca: str, ts: int) -> None:
+        """Resolve Rugcheck and on-chain data together, then edit the alert once."""
+        try:
+            (score, risk_text, lp_text, upd_short), analysis = await asyncio.gather(
+                self._fetch_rc_summary(ca), self._fetch_onchain(ca)
+            )
             # score is normalized to 0–10 string; display as /10
-            rc_tail = f"RC: score {score}/10 | risks: {risk_text} | LP {lp_text} | updAuth {upd_short}"
-            await message.edit(f"{message.raw_text} | {rc_tail}")
+            tail = f"RC: score {score}/10 | risks: {risk_text} | LP {lp_text} | updAuth {upd_short}"
+            if analysis:
+                top1 = round(analysis["top1_pct"], 1)
+                top10 = round(analysis["top10_pct"], 1)
+                holders = analysis["holders_sampled"]
+                tail += f" | Holders: top1 {top1}% | top10 {top10}% (n={holders})"
+            try:
+                await message.edit(f"{message.raw_text} | {tail}")
+            except Exception:
+                pass
             # Record summarized RC
-            await self._rc_queue.put(
+            self._rec_put((
+                "rc",
                 RugcheckEvent(
-                    ts=int(time.time()),
+                    ts=ts,
                     ca=ca,
                     score=score,
                     risk_text=risk_text,
                     lp_text=lp_text,
                     upd_short=upd_short,
-                )
-            )
-            # Kick off on-chain analysis (does not block)
-            asyncio.create_task(self._append_onchain_and_record(message, ca))
-        except Exception:
-            pass
-
-    async def _append_onchain_and_record(self, message, ca: str) -> None:
-        try:
-            analysis = await self.onchain.analyze(ca)
-            if not analysis:
-                return
-            top1 = round(analysis["top1_pct"], 1)
-            top10 = round(analysis["top10_pct"], 1)
-            holders = analysis["holders_sampled"]
-            oc_tail = f"Holders: top1 {top1}% | top10 {top10}% (n={holders})"
-            try:
-                await message.edit(f"{message.raw_text} | {oc_tail}")
-            except Exception:
-                pass
-            await self._onchain_queue.put(
-                OnchainEvent(
-                    ts=int(time.time()),
-                    ca=ca,
-                    supply_total=float(analysis["supply_total"]),
-                    decimals=int(analysis["decimals"]),
-                    top1_pct=float(analysis["top1_pct"]),
-                    top10_pct=float(analysis["top10_pct"]),
-                    holders_sampled=int(analysis["holders_sampled"]),
-                )
-            )
+                ),
+            ))
+            if analysis:
+                self._rec_put((
+                    "onchain",
+                    OnchainEvent(
+                        ts=int(time.time()),
+                        ca=ca,
+                        supply_total=float(analysis["supply_total"]),
+                        decimals=int(analysis["decimals"]),
+                        top1_pct=float(analysis["top1_pct"]),
+                        top10_pct=float(analysis["top10_pct"]),
+                        holders_sampled=int(analysis["holders_sampled"]),
+                    ),
+                ))
         except Exception:
             pass
 
-    async def _send_signal_and_snapshot(self, *, kind: str, ca: str, ug_fast: int, ug_slow: int, tracker: HotTracker, group_id: int, group_name: str | None) -> None:
+    async def _send_signal_and_snapshot(self, *, kind: str, ca: str, ug_fast: int, ug_slow: int, tracker: HotTracker, group_id: int, group_name: str | None, ts: int) -> None:
         if kind == "fast":
             msg_text = self._signal_message_fast(ca)
         else:
             msg_text = self._signal_message_slow(ca)
         sent = await self.client.send_message(self.settings.target_group, msg_text)
-        logging.info("📣 %s signal sent" % ("Fast" if kind == "fast" else "Signal"))
-        await self._signal_queue.put(
+        log.info("📣 %s signal sent", "Fast" if kind == "fast" else "Signal")
+        self._rec_put((
+            "signal",
             SignalEvent(
-                ts=int(time.time()),
+                ts=ts,
                 ca=ca,
                 group_id=group_id,
                 group_name=group_name,
                 kind=kind,
-                ug_fast=ug_fast,
-                ug_slow=ug_slow,
+                unique_groups_fast=ug_fast,
+                unique_groups_slow=ug_slow,
                 hot_threshold=self.settings.hot_threshold,
                 sent_message_id=getattr(sent, "id", None),
-                extra=None,
-            )
-        )
-        asyncio.create_task(self._append_rc_and_edit(sent, ca))
+            ),
+        ))
+        try:
+            self._rc_fetch_queue.put_nowait((sent, ca, ts))
+        except asyncio.QueueFull:
+            log.warning("RC queue full, skipping Rugcheck for %s", ca)
         vel = tracker.get_velocity_mpm(ca)
         first_ts, last_ts = tracker.get_first_last_seen(ca)
-        await self._intent_queue.put(
-            TradeIntentEvent(
-                ts=int(time.time()),
-                ca=ca,
-                kind=kind,
-                ug_fast=ug_fast,
-                ug_slow=ug_slow,
-                velocity_mpm=vel,
-                first_seen_ts=first_ts,
-                last_seen_ts=last_ts,
-                rc_score="pending",
-                rc_risk_text="pending",
-                rc_lp_text="pending",
-                rc_upd_short="pending",
-            )
+        intent = TradeIntentEvent(
+            ts=ts,
+            ca=ca,
+            kind=kind,
+            ug_fast=ug_fast,
+            ug_slow=ug_slow,
+            velocity_mpm=vel,
+            first_seen_ts=first_ts,
+            last_seen_ts=last_ts,
+            rc_score="pending",
+            rc_risk_text="pending",
+            rc_lp_text="pending",
+            rc_upd_short="pending",
         )
+        self._rec_put(("intent", intent))
+        # Send to executor for auto-trading
+        if self.executor_bridge:
+            self._intent_put(intent)
         # Mark as alerted for coalescing
-        self._any_alerted_at[ca] = time.time()
+        self._any_alerted_at[ca] = ts
 
-    async def _consume_signals(self) -> None:
-        while True:
-            ev = await self._signal_queue.get()
-            try:
-                await self.recorder.record_signal(
-                    ts=ev.ts,
-                    ca=ev.ca,
-                    group_id=ev.group_id,
-                    group_name=ev.group_name,
-                    kind=ev.kind,
-                    ug_fast=ev.ug_fast,
-                    ug_slow=ev.ug_slow,
-                    hot_threshold=ev.hot_threshold,
-                    sent_message_id=ev.sent_message_id,
-                    extra=ev.extra,
-                )
-            except Exception as exc:
-                logging.exception(f"record_signal failed: {exc}")
-            finally:
-                self._signal_queue.task_done()
+    def _rec_put(self, item: tuple[str, Any]) -> None:
+        """Queue a recorder event without blocking."""
+        self._rec_queue.put_nowait(item)
 
-    async def _consume_rugcheck(self) -> None:
+    async def _consume_records(self) -> None:
+        queue = self._rec_queue
+        dispatch = self._rec_dispatch
         while True:
-            ev = await self._rc_queue.get()
+            kind, payload = await queue.get()
             try:
-                await self.recorder.record_rugcheck(
-                    ts=ev.ts,
-                    ca=ev.ca,
-                    score=ev.score,
-                    risk_text=ev.risk_text,
-                    lp_text=ev.lp_text,
-                    upd_short=ev.upd_short,
-                )
+                await dispatch[kind](payload)
             except Exception as exc:
-                logging.exception(f"record_rugcheck failed: {exc}")
+                log.exception("record %s failed: %s", kind, exc)
             finally:
-                self._rc_queue.task_done()
+                queue.task_done()
 
-    async def _consume_onchain(self) -> None:
-        while True:
-            ev = await self._onchain_queue.get()
-            try:
-                await self.recorder.record_onchain(
-                    ts=ev.ts,
-                    ca=ev.ca,
-                    supply_total=ev.supply_total,
-                    decimals=ev.decimals,
-                    top1_pct=ev.top1_pct,
-                    top10_pct=ev.top10_pct,
-                    holders_sampled=ev.holders_sampled,
-                )
-            except Exception as exc:
-                logging.exception(f"record_onchain failed: {exc}")
-            finally:
-                self._onchain_queue.task_done()
-
-    async def _consume_mentions(self) -> None:
-        while True:
-            ev = await self._mention_queue.get()
-            try:
-                await self.recorder.record_mention(
-                    ts=ev.ts,
-                    ca=ev.ca,
-                    group_id=ev.group_id,
-                    group_name=ev.group_name,
-                    message_id=ev.message_id,
-                )
-            except Exception as exc:
-                logging.exception(f"record_mention failed: {exc}")
-            finally:
-                self._mention_queue.task_done()
+    def _intent_put(self, intent: TradeIntentEvent) -> None:
+        """Queue a trade intent without blocking, dropping the oldest if full."""
+        queue = self._intent_queue
+        try:
+            queue.put_nowait(intent)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.task_done()
+            self._intent_dropped += 1
+            queue.put_nowait(intent)
 
-    async def _consume_intents(self) -> None:
+    async def _send_intents(self) -> None:
+        queue = self._intent_queue
         while True:
-            ev = await self._intent_queue.get()
+            ev = await queue.get()
             try:
-                # Record trade intent as before
-                await self.recorder.record_trade_intent(
-                    ts=ev.ts,
-                    ca=ev.ca,
-                    kind=ev.kind,
-                    ug_fast=ev.ug_fast,
-                    ug_slow=ev.ug_slow,
-                    velocity_mpm=ev.velocity_mpm,
-                    first_seen_ts=ev.first_seen_ts,
-                    last_seen_ts=ev.last_seen_ts,
-                    rc_score=ev.rc_score,
-                    rc_risk_text=ev.rc_risk_text,
-                    rc_lp_text=ev.rc_lp_text,
-                    rc_upd_short=ev.rc_upd_short,
-                )
-                
-                # NEW: Send to executor for auto-trading
-                if self.executor_bridge:
-                    await self.executor_bridge.send_trade_intent(ev)
-                    
-            except Exception as exc:
-                logging.exception(f"record_trade_intent failed: {exc}")
+                # After a Redis stall the backlog is minutes old; trading on it
+                # would chase moves that already happened
+                if time.time() - ev.ts > _INTENT_MAX_AGE_S:
+                    self._intent_dropped += 1
+                    continue
+                await self.executor_bridge.send_trade_intent(ev)
+            except Exception:
+                log.exception("send_trade_intent failed for %s", ev.ca)
             finally:
-                self._intent_queue.task_done()
+                queue.task_done()
 
     async def _on_message(self, event) -> None:
         try:
-            chat = await event.get_chat()
-            group_name = getattr(chat, "title", "Unknown Group")
-            group_id = getattr(chat, "id", 0)
+            # One clock read per message, shared by every event and tracker call
+            now = time.time()
+            ts_now = int(now)
+            cid = event.chat_id
+            cached = self._chat_cache.get(cid)
+            if cached is None:
+                # event.chat is set synchronously once Telethon has the entity
+                chat = event.chat
+                if chat is None:
+                    chat = await event.get_chat()
+                cached = (getattr(chat, "id", 0), getattr(chat, "title", "Unknown Group"))
+                self._chat_cache[cid] = cached
+            group_id, group_name = cached
 
             if event.is_reply or event.fwd_from:
-                logging.info(f"↩️  Skip (reply/forward) in {group_name}")
+                log.info("↩️  Skip (reply/forward) in %s", group_name)
                 return
 
             text = event.raw_text or ""
 
             # Redundant entity re-appending removed; raw_text already contains entity ranges
 
-            addresses: List[str] = extract_solana_addresses(text)
+            # Short messages (the norm) parse inline; long pastes go to the pool
+            # so a regex/base58 burst doesn't stall other coroutines
+            if len(text) > _PARSE_OFFLOAD_MIN_LEN:
+                addresses: List[str] = await asyncio.get_running_loop().run_in_executor(
+                    self._parse_pool, extract_solana_addresses, text
+                )
+            else:
+                addresses = extract_solana_addresses(text)
             if not addresses:
                 return
 
-            seen = set()
+            # Bind per-message invariants once for the loop below
+            tracker_fast = self.tracker_fast
+            tracker_slow = self.tracker_slow
+            ht = self.settings.hot_threshold
+            rec_put = self._rec_put
+            message_id = getattr(event.message, "id", None)
+            recent_seen = self._recent_seen
+            any_alerted_get = self._any_alerted_at.get
+            coalesce = self._coalesce_seconds
+            send = self._send_signal_and_snapshot
+
+            # extract_solana_addresses already returns unique CAs in order
             for ca in addresses:
-                if ca in seen:
+                seen_key = (group_id, ca)
+                if seen_key in recent_seen:
                     continue
-                seen.add(ca)
-
-                ug_fast = self.tracker_fast.add_hit(ca, group_id)
-                ug_slow = self.tracker_slow.add_hit(ca, group_id)
+                recent_seen[seen_key] = None
+                ug_fast = tracker_fast.add_hit(ca, group_id, now)
+                ug_slow = tracker_slow.add_hit(ca, group_id, now)
                 # persist mention for auto-trade analytics
-                await self._mention_queue.put(
+                rec_put((
+                    "mention",
                     MentionEvent(
-                        ts=int(time.time()),
+                        ts=ts_now,
                         ca=ca,
                         group_id=group_id,
                         group_name=group_name,
-                        message_id=getattr(event.message, "id", None),
-                    )
-                )
-                logging.info(f"👀 {group_name} → {ca} (fast {ug_fast}/{self.settings.hot_threshold}, slow {ug_slow}/{self.settings.hot_threshold})")
+                        message_id=message_id,
+                    ),
+                ))
+                log.info("👀 %s → %s (fast %d/%d, slow %d/%d)", group_name, ca, ug_fast, ht, ug_slow, ht)
+
+                fire_fast = tracker_fast.should_alert(ca, ht, now)
 
-                if self.tracker_fast.should_alert(ca, self.settings.hot_threshold):
-                    await self._send_signal_and_snapshot(
+                # Suppress slow alert if a fast/slow alert for same CA was sent recently
+                last_any = ts_now if fire_fast else any_alerted_get(ca)
+                coalesce_ok = True
+                if last_any is not None and ts_now - last_any < coalesce:
+                    coalesce_ok = False
+                fire_slow = coalesce_ok and tracker_slow.should_alert(ca, ht, now)
+
+                sends = []
+                if fire_fast:
+                    sends.append(send(
                         kind="fast",
                         ca=ca,
                         ug_fast=ug_fast,
                         ug_slow=ug_slow,
-                        tracker=self.tracker_fast,
+                        tracker=tracker_fast,
                         group_id=group_id,
                         group_name=group_name,
-                    )
-
-                # Suppress slow alert if a fast/slow alert for same CA was sent recently
-                last_any = self._any_alerted_at.get(ca)
-                coalesce_ok = True
-                if last_any is not None and time.time() - last_any < self._coalesce_seconds:
-                    coalesce_ok = False
-                if coalesce_ok and self.tracker_slow.should_alert(ca, self.settings.hot_threshold):
-                    await self._send_signal_and_snapshot(
+                        ts=ts_now,
+                    ))
+                if fire_slow:
+                    sends.append(send(
                         kind="slow",
                         ca=ca,
                         ug_fast=ug_fast,
                         ug_slow=ug_slow,
-                        tracker=self.tracker_slow,
+                        tracker=tracker_slow,
                         group_id=group_id,
                         group_name=group_name,
-                    )
+                        ts=ts_now,
+                    ))
+                if len(sends) == 1:
+                    await sends[0]
+                elif sends:
+                    # Both tiers fired: overlap the two Telegram round-trips
+                    for res in await asyncio.gather(*sends, return_exceptions=True):
+                        if isinstance(res, Exception):
+                            log.error("Signal send failed for %s: %s", ca, res)
 
         except Exception as exc:
-            logging.exception(f"Handler error: {exc}")
+            log.exception("Handler error: %s", exc)
             await asyncio.sleep(0)
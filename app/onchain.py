@@ -1,8 +1,11 @@
 import asyncio
+import heapq
 import math
 from typing import Optional, Tuple, Dict, Any
 
 import aiohttp
+import orjson
+from cachetools import TTLCache
 
 
 class OnchainAnalyzer:
@@ -17,6 +20,10 @@ class OnchainAnalyzer:
         self.timeout = aiohttp.ClientTimeout(total=max(0.2, timeout_ms / 1000.0))
         self._session: Optional[aiohttp.ClientSession] = None
         self._lock = asyncio.Lock()
+        # Supply/decimals never change and top holders move slowly, so reuse
+        # recent analyses; concurrent callers for one mint share a single task
+        self._cache: TTLCache = TTLCache(maxsize=2048, ttl=120)
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     async def _get(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
@@ -24,6 +31,7 @@ class OnchainAnalyzer:
                 if self._session is None or self._session.closed:
                     self._session = aiohttp.ClientSession(
                         timeout=self.timeout,
+                        connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300, enable_cleanup_closed=True),
                         headers={
                             "content-type": "application/json",
                             "accept": "application/json",
@@ -40,10 +48,33 @@ class OnchainAnalyzer:
         try:
             session = await self._get()
             payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
-            async with session.post(self.rpc_url, json=payload) as resp:
+            # Session headers already carry content-type: application/json
+            async with session.post(self.rpc_url, data=orjson.dumps(payload)) as resp:
                 if resp.status != 200:
                     return None
-                return await resp.json(content_type=None)
+                return orjson.loads(await resp.read())
+        except Exception:
+            return None
+
+    async def _rpc_batch(self, calls: list[Tuple[str, list[Any]]]) -> Optional[list[Optional[dict]]]:
+        """Send several calls as one JSON-RPC batch; responses are returned in call order.
+
+        Returns None when the endpoint does not answer with a batch response.
+        """
+        try:
+            session = await self._get()
+            payload = [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                for i, (method, params) in enumerate(calls)
+            ]
+            async with session.post(self.rpc_url, data=orjson.dumps(payload)) as resp:
+                if resp.status != 200:
+                    return None
+                body = orjson.loads(await resp.read())
+            if not isinstance(body, list):
+                return None
+            by_id = {item.get("id"): item for item in body if isinstance(item, dict)}
+            return [by_id.get(i) for i in range(len(calls))]
         except Exception:
             return None
 
@@ -55,54 +86,78 @@ class OnchainAnalyzer:
         except Exception:
             return 0.0
 
-    async def fetch_token_supply(self, mint: str) -> Tuple[float, int]:
-        """Return (total_supply, decimals) in human units."""
-        res = await self._rpc("getTokenSupply", [mint])
+    @classmethod
+    def _parse_supply(cls, res: Optional[dict]) -> Tuple[float, int]:
         try:
             val = (res or {}).get("result", {}).get("value", {})
             amount = val.get("amount")
             decimals = int(val.get("decimals", 0))
             if isinstance(amount, str):
-                return (self._to_float(amount, decimals), decimals)
+                return (cls._to_float(amount, decimals), decimals)
         except Exception:
             pass
         return (0.0, 0)
 
-    async def fetch_top_concentration(self, mint: str, decimals: int) -> Tuple[float, float, int]:
-        """Return (top1_pct, top10_pct, holders_sampled)."""
-        res = await self._rpc("getTokenLargestAccounts", [mint, {"commitment": "confirmed"}])
+    @classmethod
+    def _parse_concentration(cls, res: Optional[dict], decimals: int) -> Tuple[float, float, int]:
         try:
             values = ((res or {}).get("result", {}) or {}).get("value", [])
             if not isinstance(values, list) or not values:
                 return (0.0, 0.0, 0)
-            amounts = []
-            for v in values:
-                amt = v.get("amount")
-                if isinstance(amt, str):
-                    try:
-                        amounts.append(self._to_float(amt, decimals))
-                    except Exception:
-                        continue
+            amounts = [cls._to_float(v["amount"], decimals) for v in values if isinstance(v.get("amount"), str)]
             if not amounts:
                 return (0.0, 0.0, 0)
-            holders_sampled = len(amounts)
-            top1 = max(amounts) if amounts else 0.0
-            top10 = sum(sorted(amounts, reverse=True)[: min(10, len(amounts))])
-            return (top1, top10, holders_sampled)
+            # nlargest returns descending order, so the first entry is top1
+            largest = heapq.nlargest(10, amounts)
+            return (largest[0], sum(largest), len(amounts))
         except Exception:
             return (0.0, 0.0, 0)
 
+    async def fetch_token_supply(self, mint: str) -> Tuple[float, int]:
+        """Return (total_supply, decimals) in human units."""
+        return self._parse_supply(await self._rpc("getTokenSupply", [mint]))
+
+    async def fetch_top_concentration(self, mint: str, decimals: int) -> Tuple[float, float, int]:
+        """Return (top1_pct, top10_pct, holders_sampled)."""
+        res = await self._rpc("getTokenLargestAccounts", [mint, {"commitment": "confirmed"}])
+        return self._parse_concentration(res, decimals)
+
     async def analyze(self, mint: str) -> Optional[Dict[str, Any]]:
         """Best-effort combined analysis.
 
         Returns dict with: supply_total, decimals, top1_pct, top10_pct, holders_sampled.
         Percentages are relative to total supply.
         """
+        cached = self._cache.get(mint)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(mint)
+        if task is None:
+            task = asyncio.create_task(self._analyze_uncached(mint))
+            self._inflight[mint] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(mint, None))
+        result = await asyncio.shield(task)
+        if result is not None:
+            self._cache[mint] = result
+        return result
+
+    async def _analyze_uncached(self, mint: str) -> Optional[Dict[str, Any]]:
         try:
-            supply_total, decimals = await self.fetch_token_supply(mint)
+            # Both calls go out in one round-trip; largest accounts are scaled
+            # once decimals are known from the supply response
+            calls = [
+                ("getTokenSupply", [mint]),
+                ("getTokenLargestAccounts", [mint, {"commitment": "confirmed"}]),
+            ]
+            responses = await self._rpc_batch(calls)
+            if responses is None:
+                # Endpoint without batch support: issue the two calls concurrently
+                responses = await asyncio.gather(*(self._rpc(method, params) for method, params in calls))
+            supply_res, largest_res = responses
+            supply_total, decimals = self._parse_supply(supply_res)
             if supply_total <= 0.0:
                 return None
-            top1_raw, top10_raw, holders_sampled = await self.fetch_top_concentration(mint, decimals)
+            top1_raw, top10_raw, holders_sampled = self._parse_concentration(largest_res, decimals)
             top1_pct = (top1_raw / supply_total) * 100.0 if supply_total > 0 else 0.0
             top10_pct = (top10_raw / supply_total) * 100.0 if supply_total > 0 else 0.0
             # Clamp for safety
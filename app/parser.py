@@ -1,26 +1,41 @@
+import functools
 import re
-from typing import List, Set
-import base58
+from typing import List, Set, Tuple
 
-# Base58 without 0,O,I,l and length 32-48 chars (allow pump-style endings)
-SOLANA_CA_PATTERN = re.compile(r"\b([1-9A-HJ-NP-Za-km-z]{32,48})\b")
+# Prefer the compiled decoder when installed; base58 is pure Python
+try:
+    import based58
+
+    def _b58decode(addr: str) -> bytes:
+        return based58.b58decode(addr.encode("ascii"))
+except ImportError:
+    import base58
 
-# Common noise words to ignore (symbols, tickers, keywords)
-_NOISE: Set[str] = {
-    "CA", "Ca", "CA:", "Ca:", "SOL", "Sol", "PUMP", "pump",
-    "BUY", "buy", "Chart", "chart", "Link", "link",
-}
+    def _b58decode(addr: str) -> bytes:
+        return base58.b58decode(addr)
+
+# Base58 without 0,O,I,l and length 32-48 chars (allow pump-style endings).
+# The length floor and alphabet already exclude short tickers/keywords and
+# hex "0x..." strings, so matches need no further noise filtering.
+SOLANA_CA_PATTERN = re.compile(r"\b([1-9A-HJ-NP-Za-km-z]{32,48})\b")
 
 _INVISIBLE = "\u200b\u200c\u200d\u2060\ufeff\u00a0"
+_INVISIBLE_TABLE = str.maketrans("", "", _INVISIBLE)
 
 
 def _strip_invisible(token: str) -> str:
-    return token.translate({ord(c): None for c in _INVISIBLE})
+    # Every invisible char is non-ASCII, so ASCII tokens (all regex matches) pass through
+    if token.isascii():
+        return token
+    return token.translate(_INVISIBLE_TABLE)
 
 
 def _is_valid_solana(addr: str) -> bool:
+    # 32 bytes never encode to more than 44 base58 chars
+    if len(addr) > 44:
+        return False
     try:
-        raw = base58.b58decode(addr)
+        raw = _b58decode(addr)
     except Exception:
         return False
     return len(raw) == 32
@@ -37,27 +52,31 @@ def _normalize_candidate(token: str) -> str:
     return ""
 
 
+# Shortest run SOLANA_CA_PATTERN can match; shorter messages skip the scan
+_MIN_CA_LEN = 32
+
+
 def extract_solana_addresses(text: str) -> List[str]:
-    if not text:
+    if not text or len(text) < _MIN_CA_LEN:
         return []
+    return list(_extract_cached(text))
 
+
+@functools.lru_cache(maxsize=4096)
+def _extract_cached(text: str) -> Tuple[str, ...]:
+    # Copy-pasted/forwarded calls repeat verbatim across groups, so identical
+    # texts are answered from the cache without re-running regex + base58
     matches = SOLANA_CA_PATTERN.findall(text)
 
-    addresses: List[str] = []
+    # Single pass: validate and dedupe (preserving order) together; repeats
+    # of an already-accepted token skip validation entirely
+    seen: Set[str] = set()
+    unique: List[str] = []
     for token in matches:
-        if token in _NOISE:
-            continue
-        if token.startswith("0x"):
+        if token in seen:
             continue
         norm = _normalize_candidate(token)
-        if norm:
-            addresses.append(norm)
-
-    # Deduplicate preserving order
-    seen: Set[str] = set()
-    unique: List[str] = []
-    for a in addresses:
-        if a not in seen:
-            seen.add(a)
-            unique.append(a)
-    return unique
+        if norm and norm not in seen:
+            seen.add(norm)
+            unique.append(norm)
+    return tuple(unique)
@@ -1,14 +1,83 @@
 import asyncio
-import aiosqlite
-import json
-from typing import Any, Dict, Optional
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import orjson
+
+
+log = logging.getLogger(__name__)
+
+# Insert column order per table; these are also the field names of the
+# matching event dataclasses in .events.
+_COLUMNS: Dict[str, Tuple[str, ...]] = {
+    "signals": (
+        "ts", "ca", "group_id", "group_name", "kind", "unique_groups_fast",
+        "unique_groups_slow", "hot_threshold", "sent_message_id", "extra",
+    ),
+    "rugcheck": ("ts", "ca", "score", "risk_text", "lp_text", "upd_short"),
+    "mentions": ("ts", "ca", "group_id", "group_name", "message_id"),
+    "trade_intents": (
+        "ts", "ca", "kind", "ug_fast", "ug_slow", "velocity_mpm", "first_seen_ts",
+        "last_seen_ts", "rc_score", "rc_risk_text", "rc_lp_text", "rc_upd_short",
+    ),
+    "onchain": ("ts", "ca", "supply_total", "decimals", "top1_pct", "top10_pct", "holders_sampled"),
+}
+
+_INSERT_SQL: Dict[str, str] = {
+    table: f"INSERT INTO {table} ({', '.join(cols)}) VALUES ({', '.join('?' * len(cols))})"
+    for table, cols in _COLUMNS.items()
+}
+
+# Event -> row tuple in column order, read in C by attrgetter
+_EVENT_ROW: Dict[str, Callable[[Any], tuple]] = {
+    table: attrgetter(*cols) for table, cols in _COLUMNS.items()
+}
+_signal_fields = _EVENT_ROW["signals"]
+
+
+def _signal_row(ev: Any) -> tuple:
+    # extra is stored as already-serialized JSON text; nothing queries
+    # inside it, so SQLite isn't asked to re-parse it with json(?)
+    row = _signal_fields(ev)
+    return row if row[9] is None else (*row[:9], orjson.dumps(row[9]).decode())
+
+
+_EVENT_ROW["signals"] = _signal_row
+
+# Writer flushes after this many rows or this long after the first queued row
+_BATCH_MAX_ROWS = 500
+_BATCH_MAX_WAIT_S = 0.05
+# Bound on rows waiting for the writer; when full the oldest row is dropped
+_QUEUE_MAX_ROWS = 10000
+# Truncate the WAL after a commit at most this often to bound its growth
+_CHECKPOINT_INTERVAL_S = 600
+# Return up to this many free pages to the OS every interval
+_VACUUM_INTERVAL_S = 1800
+_VACUUM_PAGES = 1000
 
 
 class SignalRecorder:
+    """Async SQLite recorder with a single long-lived writer.
+
+    record_event only enqueues rows; a background writer task drains the
+    queue and commits each batch with one executemany per table. The stdlib
+    sqlite3 connection is only ever touched from one dedicated thread.
+    """
+
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
         self._init_lock = asyncio.Lock()
         self._initialized = False
+        self._db: Optional[sqlite3.Connection] = None
+        # One thread matches SQLite's single-writer model; every DB call runs here
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-writer")
+        self._queue: asyncio.Queue[Tuple[str, tuple]] = asyncio.Queue(maxsize=_QUEUE_MAX_ROWS)
+        # Rows discarded because the writer fell behind
+        self.dropped = 0
+        self._writer_task: Optional[asyncio.Task] = None
 
     async def _ensure_initialized(self) -> None:
         if self._initialized:
@@ -16,228 +85,237 @@ class SignalRecorder:
         async with self._init_lock:
             if self._initialized:
                 return
-            async with aiosqlite.connect(self.db_path) as db:
-                # Performance and concurrency pragmas for WAL
-                await db.execute("PRAGMA journal_mode=WAL")
-                await db.execute("PRAGMA synchronous=NORMAL")
-                await db.execute("PRAGMA temp_store=MEMORY")
-                await db.execute("PRAGMA mmap_size=268435456")
-                await db.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS signals (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        ts INTEGER NOT NULL,
-                        ca TEXT NOT NULL,
-                        group_id INTEGER NOT NULL,
-                        group_name TEXT,
-                        kind TEXT NOT NULL, -- fast|slow
-                        unique_groups_fast INTEGER,
-                        unique_groups_slow INTEGER,
-                        hot_threshold INTEGER,
-                        sent_message_id INTEGER,
-                        extra JSON
-                    )
-                    """
-                )
-                await db.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS rugcheck (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        ts INTEGER NOT NULL,
-                        ca TEXT NOT NULL,
-                        score TEXT,
-                        risk_text TEXT,
-                        lp_text TEXT,
-                        upd_short TEXT
-                    )
-                    """
-                )
-                await db.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS mentions (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        ts INTEGER NOT NULL,
-                        ca TEXT NOT NULL,
-                        group_id INTEGER NOT NULL,
-                        group_name TEXT,
-                        message_id INTEGER
-                    )
-                    """
-                )
-                await db.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS trade_intents (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        ts INTEGER NOT NULL,
-                        ca TEXT NOT NULL,
-                        kind TEXT NOT NULL, -- fast|slow
-                        ug_fast INTEGER,
-                        ug_slow INTEGER,
-                        velocity_mpm REAL,
-                        first_seen_ts INTEGER,
-                        last_seen_ts INTEGER,
-                        rc_score TEXT,
-                        rc_risk_text TEXT,
-                        rc_lp_text TEXT,
-                        rc_upd_short TEXT
-                    )
-                    """
-                )
-                await db.execute(
-                    """
-                    CREATE TABLE IF NOT EXISTS onchain (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        ts INTEGER NOT NULL,
-                        ca TEXT NOT NULL,
-                        supply_total REAL,
-                        decimals INTEGER,
-                        top1_pct REAL,
-                        top10_pct REAL,
-                        holders_sampled INTEGER
-                    )
-                    """
-                )
-                # Indexes for efficiency
-                await db.execute("CREATE INDEX IF NOT EXISTS idx_signals_ts ON signals(ts)")
-                await db.execute("CREATE INDEX IF NOT EXISTS idx_signals_ca ON signals(ca)")
-                await db.execute("CREATE INDEX IF NOT EXISTS idx_mentions_ca_ts ON mentions(ca, ts)")
-                await db.execute("CREATE INDEX IF NOT EXISTS idx_trade_intents_ts ON trade_intents(ts)")
-                await db.execute("CREATE INDEX IF NOT EXISTS idx_trade_intents_ca ON trade_intents(ca)")
-                await db.execute("CREATE INDEX IF NOT EXISTS idx_onchain_ca_ts ON onchain(ca, ts)")
-                await db.commit()
+            loop = asyncio.get_running_loop()
+            self._db = await loop.run_in_executor(self._pool, self._open_db)
+            self._writer_task = asyncio.create_task(self._writer_loop())
             self._initialized = True
 
-    async def record_signal(
-        self,
-        *,
-        ts: int,
-        ca: str,
-        group_id: int,
-        group_name: Optional[str],
-        kind: str,
-        ug_fast: Optional[int],
-        ug_slow: Optional[int],
-        hot_threshold: int,
-        sent_message_id: Optional[int],
-        extra: Optional[Dict[str, Any]] = None,
-    ) -> None:
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO signals (ts, ca, group_id, group_name, kind,
-                                     unique_groups_fast, unique_groups_slow,
-                                     hot_threshold, sent_message_id, extra)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, json(?))
-                """,
-                (
-                    ts,
-                    ca,
-                    group_id,
-                    group_name,
-                    kind,
-                    ug_fast,
-                    ug_slow,
-                    hot_threshold,
-                    sent_message_id,
-                    (None if extra is None else json.dumps(extra)),
-                ),
+    def _open_db(self) -> sqlite3.Connection:
+        # _INSERT_SQL strings are module constants, so sqlite3's per-connection
+        # statement cache (keyed on SQL text) reuses each prepared insert
+        db = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None, cached_statements=256
+        )
+        # Performance and concurrency pragmas for WAL. page_size and auto_vacuum
+        # only take effect on a fresh database, before WAL and any table exist.
+        db.execute("PRAGMA page_size=8192")
+        if db.execute("PRAGMA page_count").fetchone()[0] == 0:
+            db.execute("PRAGMA auto_vacuum=INCREMENTAL")
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA busy_timeout=5000")
+        db.execute("PRAGMA cache_size=-64000")
+        db.execute("PRAGMA foreign_keys=ON")
+        db.execute("PRAGMA temp_store=MEMORY")
+        db.execute("PRAGMA mmap_size=268435456")
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS signals (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts INTEGER NOT NULL,
+                ca TEXT NOT NULL,
+                group_id INTEGER NOT NULL,
+                group_name TEXT,
+                kind TEXT NOT NULL, -- fast|slow
+                unique_groups_fast INTEGER,
+                unique_groups_slow INTEGER,
+                hot_threshold INTEGER,
+                sent_message_id INTEGER,
+                extra JSON
             )
-            await db.commit()
-
-    async def record_rugcheck(self, *, ts: int, ca: str, score: str, risk_text: str, lp_text: str, upd_short: str) -> None:
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO rugcheck (ts, ca, score, risk_text, lp_text, upd_short)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (ts, ca, score, risk_text, lp_text, upd_short),
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS rugcheck (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts INTEGER NOT NULL,
+                ca TEXT NOT NULL,
+                score TEXT,
+                risk_text TEXT,
+                lp_text TEXT,
+                upd_short TEXT
             )
-            await db.commit()
-
-    async def record_mention(self, *, ts: int, ca: str, group_id: int, group_name: str | None, message_id: int | None) -> None:
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO mentions (ts, ca, group_id, group_name, message_id)
-                VALUES (?, ?, ?, ?, ?)
-                """,
-                (ts, ca, group_id, group_name, message_id),
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS mentions (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts INTEGER NOT NULL,
+                ca TEXT NOT NULL,
+                group_id INTEGER NOT NULL,
+                group_name TEXT,
+                message_id INTEGER
             )
-            await db.commit()
-
-    async def record_trade_intent(
-        self,
-        *,
-        ts: int,
-        ca: str,
-        kind: str,
-        ug_fast: int | None,
-        ug_slow: int | None,
-        velocity_mpm: float,
-        first_seen_ts: int | None,
-        last_seen_ts: int | None,
-        rc_score: str,
-        rc_risk_text: str,
-        rc_lp_text: str,
-        rc_upd_short: str,
-    ) -> None:
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO trade_intents (ts, ca, kind, ug_fast, ug_slow, velocity_mpm,
-                                           first_seen_ts, last_seen_ts, rc_score, rc_risk_text, rc_lp_text, rc_upd_short)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    ts,
-                    ca,
-                    kind,
-                    ug_fast,
-                    ug_slow,
-                    velocity_mpm,
-                    first_seen_ts,
-                    last_seen_ts,
-                    rc_score,
-                    rc_risk_text,
-                    rc_lp_text,
-                    rc_upd_short,
-                ),
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS trade_intents (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts INTEGER NOT NULL,
+                ca TEXT NOT NULL,
+                kind TEXT NOT NULL, -- fast|slow
+                ug_fast INTEGER,
+                ug_slow INTEGER,
+                velocity_mpm REAL,
+                first_seen_ts INTEGER,
+                last_seen_ts INTEGER,
+                rc_score TEXT,
+                rc_risk_text TEXT,
+                rc_lp_text TEXT,
+                rc_upd_short TEXT
             )
-            await db.commit()
-
-    async def record_onchain(
-        self,
-        *,
-        ts: int,
-        ca: str,
-        supply_total: float,
-        decimals: int,
-        top1_pct: float,
-        top10_pct: float,
-        holders_sampled: int,
-    ) -> None:
-        await self._ensure_initialized()
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """
-                INSERT INTO onchain (ts, ca, supply_total, decimals, top1_pct, top10_pct, holders_sampled)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    ts,
-                    ca,
-                    supply_total,
-                    decimals,
-                    top1_pct,
-                    top10_pct,
-                    holders_sampled,
-                ),
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS onchain (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                ts INTEGER NOT NULL,
+                ca TEXT NOT NULL,
+                supply_total REAL,
+                decimals INTEGER,
+                top1_pct REAL,
+                top10_pct REAL,
+                holders_sampled INTEGER
             )
-            await db.commit()
+            """
+        )
+        # Indexes for efficiency
+        db.execute("CREATE INDEX IF NOT EXISTS idx_signals_ts ON signals(ts)")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_signals_ca ON signals(ca)")
+        # Per-tier partial indexes stay small enough to remain in the page cache
+        db.execute("CREATE INDEX IF NOT EXISTS idx_signals_fast_ca_ts ON signals(ca, ts) WHERE kind = 'fast'")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_signals_slow_ca_ts ON signals(ca, ts) WHERE kind = 'slow'")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_mentions_ca_ts ON mentions(ca, ts)")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_trade_intents_ts ON trade_intents(ts)")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_trade_intents_ca ON trade_intents(ca)")
+        db.execute("CREATE INDEX IF NOT EXISTS idx_onchain_ca_ts ON onchain(ca, ts)")
+        return db
+
+    def _write_batch(self, by_table: Dict[str, List[tuple]]) -> None:
+        db = self._db
+        # Take the write lock up front so the batch never hits a
+        # SQLITE_BUSY on a read-to-write upgrade mid-transaction
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for table, rows in by_table.items():
+                db.executemany(_INSERT_SQL[table], rows)
+            db.execute("COMMIT")
+            return
+        except Exception as exc:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            log.warning("recorder batch insert failed, retrying rows one by one: %s", exc)
+        self._write_rows(by_table)
+
+    def _write_rows(self, by_table: Dict[str, List[tuple]]) -> None:
+        # A failed INSERT only undoes its own statement, so the good rows of a
+        # bad batch still commit together and just the offending ones are dropped
+        db = self._db
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            for table, rows in by_table.items():
+                sql = _INSERT_SQL[table]
+                for row in rows:
+                    try:
+                        db.execute(sql, row)
+                    except Exception as exc:
+                        log.error("recorder dropped %s row %r: %s", table, row, exc)
+            db.execute("COMMIT")
+        except Exception:
+            if db.in_transaction:
+                db.execute("ROLLBACK")
+            raise
+
+    def _incremental_vacuum(self) -> None:
+        # The pragma frees one page per step, so the cursor must be drained
+        self._db.execute(f"PRAGMA incremental_vacuum({_VACUUM_PAGES})").fetchall()
 
+    async def _writer_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        last_checkpoint = last_vacuum = loop.time()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + _BATCH_MAX_WAIT_S
+            while len(batch) < _BATCH_MAX_ROWS:
+                try:
+                    batch.append(self._queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            by_table: Dict[str, List[tuple]] = {}
+            for table, row in batch:
+                by_table.setdefault(table, []).append(row)
+            try:
+                await loop.run_in_executor(self._pool, self._write_batch, by_table)
+            except Exception as exc:
+                log.exception("recorder batch write failed (%d rows): %s", len(batch), exc)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+            if loop.time() - last_vacuum >= _VACUUM_INTERVAL_S:
+                last_vacuum = loop.time()
+                try:
+                    await loop.run_in_executor(self._pool, self._incremental_vacuum)
+                except Exception as exc:
+                    log.warning("recorder incremental vacuum failed: %s", exc)
+            if loop.time() - last_checkpoint >= _CHECKPOINT_INTERVAL_S:
+                last_checkpoint = loop.time()
+                try:
+                    await loop.run_in_executor(self._pool, self._db.execute, "PRAGMA wal_checkpoint(TRUNCATE)")
+                except Exception as exc:
+                    log.warning("recorder WAL checkpoint failed: %s", exc)
+
+    def _put(self, item: Tuple[str, tuple]) -> None:
+        # Never block the caller on a slow disk; shed the oldest row instead
+        queue = self._queue
+        try:
+            queue.put_nowait(item)
+        except asyncio.QueueFull:
+            queue.get_nowait()
+            queue.task_done()
+            self.dropped += 1
+            queue.put_nowait(item)
+
+    async def _enqueue(self, table: str, row: tuple) -> None:
+        await self._ensure_initialized()
+        self._put((table, row))
+
+    async def flush(self) -> None:
+        """Wait until every queued row has been committed."""
+        if self._initialized:
+            await self._queue.join()
+
+    async def close(self) -> None:
+        """Flush queued rows and close the connection."""
+        if not self._initialized:
+            return
+        await self.flush()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(self._pool, self._db.execute, "PRAGMA optimize")
+        except Exception:
+            pass
+        await loop.run_in_executor(self._pool, self._db.close)
+        self._pool.shutdown(wait=False)
+        self._initialized = False
 
+    async def record_event(self, table: str, ev: Any) -> None:
+        """Queue an event dataclass whose field names match the table's columns."""
+        await self._enqueue(table, _EVENT_ROW[table](ev))
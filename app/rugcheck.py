@@ -1,24 +1,66 @@
 import asyncio
+import random
 import sys
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 import aiohttp
+from cachetools import TTLCache
 import json as _json
-from urllib.request import Request, urlopen
-from urllib.error import URLError, HTTPError
 
 # Do not mutate global event loop policy from a library module. If Windows-specific
 # policy is required for the top-level app, set it explicitly in the entrypoint.
 
 
+# Overall time budget (seconds) for one report lookup, sleeps included
+_REPORT_DEADLINE_S = 15.0
+
+
+def _backoff(attempt: int) -> float:
+    """Jittered exponential delay (seconds) before retry number `attempt`."""
+    return min(1.0, 0.2 * 2 ** (attempt - 1)) * random.uniform(0.5, 1.5)
+
+
+def _normalize_to_ten(val) -> str:
+    """Normalize a Rugcheck score to the 0–10 range for display/storage."""
+    try:
+        v = float(val)
+    except Exception:
+        return "n/a"
+    if v <= 10:
+        s10 = v
+    elif v <= 100:
+        s10 = v / 10.0
+    elif v <= 1000:
+        s10 = v / 100.0
+    else:
+        s10 = 10.0
+    if s10 < 0:
+        s10 = 0.0
+    if s10 > 10:
+        s10 = 10.0
+    return f"{s10:.1f}"
+
+
 class RugcheckClient:
     def __init__(self, timeout_ms: int) -> None:
         self.timeout = aiohttp.ClientTimeout(total=timeout_ms / 1000.0)
         self._session: Optional[aiohttp.ClientSession] = None
+        # Reports are reused for a couple of minutes; concurrent lookups of
+        # the same mint share one in-flight task
+        self._cache: TTLCache = TTLCache(maxsize=2048, ttl=120)
+        self._inflight: Dict[str, asyncio.Task] = {}
 
     async def _get_session(self) -> aiohttp.ClientSession:
         if self._session is None or self._session.closed:
+            # Keep TLS connections to api.rugcheck.xyz warm between lookups
             self._session = aiohttp.ClientSession(
                 timeout=self.timeout,
+                connector=aiohttp.TCPConnector(
+                    limit=64,
+                    limit_per_host=16,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=30,
+                    enable_cleanup_closed=True,
+                ),
                 headers={
                     "accept": "application/json",
                     "user-agent": "callsbotsimp/1.0 (+local)"
@@ -31,6 +73,20 @@ class RugcheckClient:
             await self._session.close()
 
     async def fetch_report(self, mint: str) -> Optional[dict]:
+        cached = self._cache.get(mint)
+        if cached is not None:
+            return cached
+        task = self._inflight.get(mint)
+        if task is None:
+            task = asyncio.create_task(self._fetch_report_uncached(mint))
+            self._inflight[mint] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(mint, None))
+        report = await asyncio.shield(task)
+        if report is not None:
+            self._cache[mint] = report
+        return report
+
+    async def _fetch_report_uncached(self, mint: str) -> Optional[dict]:
         try:
             session = await self._get_session()
             raw = (mint or "").strip()
@@ -41,12 +97,17 @@ class RugcheckClient:
             elif len(raw) == 44:  # Might be a base mint that needs "pump" suffix
                 candidates.append(raw + "pump")
 
+            # One lookup may not hold an RC worker past this, however many
+            # candidates and retries it has left
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + _REPORT_DEADLINE_S
             for candidate in candidates:
                 url = f"https://api.rugcheck.xyz/v1/tokens/{candidate}/report"
                 # Retry a few times for transient limits/outages
                 attempts = 0
-                while attempts < 3:
+                while attempts < 5:
                     attempts += 1
+                    delay = _backoff(attempts)
                     try:
                         async with session.get(url) as resp:
                             if resp.status == 200:
@@ -59,37 +120,21 @@ class RugcheckClient:
                                         return _json.loads(text)
                                     except Exception:
                                         return None
-                            # Backoff for transient errors and 429
-                            if resp.status in (429, 500, 502, 503, 504):
-                                await asyncio.sleep(0.4 * attempts)
-                                continue
                             # Other 4xx: give up on this candidate
-                            break
-                    except asyncio.TimeoutError:
-                        await asyncio.sleep(0.2 * attempts)
-                        continue
+                            if resp.status not in (429, 500, 502, 503, 504):
+                                break
+                            # Prefer the server's Retry-After (seconds form) when given
+                            retry_after = resp.headers.get("Retry-After", "")
+                            if retry_after.isdigit():
+                                delay = float(retry_after)
                     except Exception:
-                        # Unknown error: try next attempt/candidate
-                        await asyncio.sleep(0.2 * attempts)
-                        continue
-                # Fallback: try a simple synchronous GET via urllib in a thread
-                try:
-                    def _sync_get_json(u: str):
-                        req = Request(u, headers={
-                            "accept": "application/json",
-                            "user-agent": "callsbotsimp/1.0 (+local)"
-                        })
-                        with urlopen(req, timeout=max(1, int(self.timeout.total))) as r:  # type: ignore[attr-defined]
-                            data = r.read()
-                            try:
-                                return _json.loads(data.decode("utf-8", "ignore"))
-                            except Exception:
-                                return None
-                    j = await asyncio.to_thread(_sync_get_json, url)
-                    if isinstance(j, dict):
-                        return j
-                except (URLError, HTTPError, Exception):
-                    pass
+                        # Timeout or unknown error: try next attempt/candidate
+                        pass
+                    # No point waiting once this candidate is out of attempts
+                    if attempts < 5:
+                        if loop.time() + delay >= deadline:
+                            return None
+                        await asyncio.sleep(delay)
             return None
         except Exception:
             return None
@@ -98,39 +143,20 @@ class RugcheckClient:
     def summarize(report: dict) -> Tuple[str, str, str, str]:
         if not report:
             return ("pending", "pending", "pending", "pending")
-        score = report.get("score")
-        risks = report.get("risks") or []
-        risk_names = [r.get("name", "?") for r in risks][:2]
-        risk_text = "none" if not risk_names else ",".join(risk_names)
+        get = report.get
+        score = get("score")
+        # Only the first two risk names are shown; don't walk the rest
+        risk_names = [r.get("name", "?") for r in (get("risks") or [])[:2]]
+        risk_text = ",".join(risk_names) if risk_names else "none"
         lp_pct = None
         try:
-            markets = report.get("markets") or []
+            markets = get("markets")
             if markets:
                 lp_pct = markets[0].get("lp", {}).get("lpLockedPct")
         except Exception:
             lp_pct = None
         lp_text = f"{round(lp_pct)}%" if isinstance(lp_pct, (int, float)) else "n/a"
-        upd = (report.get("tokenMeta") or {}).get("updateAuthority")
+        upd = (get("tokenMeta") or {}).get("updateAuthority")
         upd_short = f"{upd[:4]}…{upd[-4:]}" if isinstance(upd, str) and len(upd) > 8 else (upd or "n/a")
-        # Normalize score to 0–10 range for display/storage
-        def _normalize_to_ten(val) -> str:
-            try:
-                v = float(val)
-            except Exception:
-                return "n/a"
-            if v <= 10:
-                s10 = v
-            elif v <= 100:
-                s10 = v / 10.0
-            elif v <= 1000:
-                s10 = v / 100.0
-            else:
-                s10 = 10.0
-            if s10 < 0:
-                s10 = 0.0
-            if s10 > 10:
-                s10 = 10.0
-            return f"{s10:.1f}"
-
         norm_score = _normalize_to_ten(score) if score is not None else "n/a"
-        return (norm_score, risk_text, lp_text, upd_short)
\ No newline at end of file
+        return (norm_score, risk_text, lp_text, upd_short)
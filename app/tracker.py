@@ -1,68 +1,123 @@
+import heapq
 import time
-from typing import Dict, Set, Tuple
+from typing import Dict, List, Tuple
 
 
 class HotTracker:
     def __init__(self, ttl_seconds: int) -> None:
         self.ttl_seconds = ttl_seconds
-        # ca -> (group_ids_set, last_updated)
-        self._by_ca: Dict[str, Tuple[Set[int], float]] = {}
-        # ca -> alerted flag timestamp
-        self._alerted_at: Dict[str, float] = {}
-        # ca -> (first_seen_ts, last_seen_ts, count)
-        self._meta: Dict[str, Tuple[float, float, int]] = {}
+        # Struct-of-arrays: one ca -> slot lookup, then parallel per-slot columns
+        self._idx: Dict[str, int] = {}
+        self._cas: List[str] = []
+        # Groups seen in the current window, as a bitset over _group_bit
+        self._groups: List[int] = []
+        # Last hit (also the window's last-seen); 0.0 when the window is empty
+        self._last_ts: List[float] = []
+        # First hit of the current window and hits counted in it
+        self._first_ts: List[float] = []
+        self._count: List[int] = []
+        # Last alert; 0.0 when never alerted
+        self._alert_ts: List[float] = []
+        # group_id -> bit position; monitored groups number in the dozens
+        self._group_bit: Dict[int, int] = {}
+        # Min-heap of (expiry_ts, ca), one entry per slot; entries are pushed
+        # forward lazily when popped, so sweeps only touch due slots
+        self._expiry: List[Tuple[float, str]] = []
 
     def _expired(self, ts: float, now: float) -> bool:
         return now - ts > self.ttl_seconds
 
-    def add_hit(self, ca: str, group_id: int) -> int:
-        now = time.time()
-        groups, ts = self._by_ca.get(ca, (set(), 0.0))
-        if self._expired(ts, now):
-            groups = set()
-        groups.add(group_id)
-        self._by_ca[ca] = (groups, now)
-        first, last, cnt = self._meta.get(ca, (now, 0.0, 0))
-        if self._expired(last or now, now):
-            first, cnt = now, 0
-        self._meta[ca] = (first, now, cnt + 1)
-        return len(groups)
+    def _slot(self, ca: str, now: float) -> int:
+        i = self._idx.get(ca)
+        if i is None:
+            heapq.heappush(self._expiry, (now + self.ttl_seconds, ca))
+            i = len(self._cas)
+            self._idx[ca] = i
+            self._cas.append(ca)
+            self._groups.append(0)
+            self._last_ts.append(0.0)
+            self._first_ts.append(0.0)
+            self._count.append(0)
+            self._alert_ts.append(0.0)
+        return i
 
-    def should_alert(self, ca: str, threshold: int) -> bool:
-        now = time.time()
-        groups, ts = self._by_ca.get(ca, (set(), 0.0))
-        if self._expired(ts, now):
+    def add_hit(self, ca: str, group_id: int, now: float | None = None) -> int:
+        if now is None:
+            now = time.time()
+        bit = self._group_bit.get(group_id)
+        if bit is None:
+            bit = self._group_bit[group_id] = len(self._group_bit)
+        i = self._slot(ca, now)
+        if self._expired(self._last_ts[i], now):
+            # Window lapsed (or new CA): start counting afresh
+            groups = 0
+            self._first_ts[i] = now
+            self._count[i] = 0
+        else:
+            groups = self._groups[i]
+        groups |= 1 << bit
+        self._groups[i] = groups
+        self._last_ts[i] = now
+        self._count[i] += 1
+        return groups.bit_count()
+
+    def should_alert(self, ca: str, threshold: int, now: float | None = None) -> bool:
+        if now is None:
+            now = time.time()
+        i = self._idx.get(ca)
+        if i is None or self._expired(self._last_ts[i], now):
             return False
-        if len(groups) < threshold:
+        if self._groups[i].bit_count() < threshold:
             return False
-        alerted_ts = self._alerted_at.get(ca)
+        alerted_ts = self._alert_ts[i]
         if alerted_ts and not self._expired(alerted_ts, now):
             return False
-        self._alerted_at[ca] = now
+        self._alert_ts[i] = now
         return True
 
-    def clear_expired(self) -> None:
-        now = time.time()
-        # Expired counts
-        for ca, (_, ts) in list(self._by_ca.items()):
-            if self._expired(ts, now):
-                self._by_ca.pop(ca, None)
-        # Expired alert markers
-        for ca, ts in list(self._alerted_at.items()):
-            if self._expired(ts, now):
-                self._alerted_at.pop(ca, None)
-        # Expired meta
-        for ca, (_, last, _) in list(self._meta.items()):
-            if self._expired(last, now):
-                self._meta.pop(ca, None)
+    def _remove(self, i: int) -> None:
+        # Swap-remove: move the last slot into i so the columns stay dense
+        last = len(self._cas) - 1
+        ca = self._cas[i]
+        if i != last:
+            moved = self._cas[last]
+            self._idx[moved] = i
+            for col in (self._cas, self._groups, self._last_ts, self._first_ts, self._count, self._alert_ts):
+                col[i] = col[last]
+        for col in (self._cas, self._groups, self._last_ts, self._first_ts, self._count, self._alert_ts):
+            col.pop()
+        del self._idx[ca]
+
+    def clear_expired(self, now: float | None = None) -> None:
+        if now is None:
+            now = time.time()
+        heap = self._expiry
+        ttl = self.ttl_seconds
+        while heap and heap[0][0] < now:
+            _, ca = heapq.heappop(heap)
+            i = self._idx.get(ca)
+            if i is None:
+                continue
+            # A slot lives until both its hit window and alert marker lapse
+            expiry = max(self._last_ts[i], self._alert_ts[i]) + ttl
+            if expiry >= now:
+                heapq.heappush(heap, (expiry, ca))
+            else:
+                self._remove(i)
 
     def get_velocity_mpm(self, ca: str) -> float:
-        first, last, cnt = self._meta.get(ca, (0.0, 0.0, 0))
+        i = self._idx.get(ca)
+        if i is None:
+            return 0.0
+        first, last, cnt = self._first_ts[i], self._last_ts[i], self._count[i]
         if cnt < 2 or last <= first:
             return 0.0
         minutes = (last - first) / 60.0
         return cnt / minutes if minutes > 0 else 0.0
 
     def get_first_last_seen(self, ca: str) -> Tuple[int | None, int | None]:
-        first, last, _ = self._meta.get(ca, (0.0, 0.0, 0))
-        return (int(first) if first else None, int(last) if last else None)
\ No newline at end of file
+        i = self._idx.get(ca)
+        if i is None:
+            return (None, None)
+        first, last = self._first_ts[i], self._last_ts[i]
+        return (int(first) if first else None, int(last) if last else None)
@@ -1,9 +1,9 @@
 import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ExecutorSettings:
     # Wallet & RPC
     private_key: str
@@ -38,6 +38,9 @@ class ExecutorSettings:
     profit_tiers_csv: str
     # CSV of multiple:trail_pct used to ratchet trailing stop
     trailing_zones_csv: str
+    # Parsed once at load: (multiple, pct) pairs sorted by multiple; empty if malformed
+    profit_tiers: Tuple[Tuple[float, float], ...]
+    trailing_zones: Tuple[Tuple[float, float], ...]
     # Keep this fraction as permanent runner (never sell via tiers)
     min_runner_pct: float
     # Cooldown between partial sells in seconds
@@ -77,7 +80,28 @@ class ExecutorSettings:
     idempotency_ttl_sec: int
 
 
+def _parse_pairs_csv(csv: str) -> Tuple[Tuple[float, float], ...]:
+    """Parse "5:0.10,8:0.10" into ((5.0, 0.1), (8.0, 0.1)) sorted by the first value."""
+    try:
+        pairs = []
+        for item in csv.split(','):
+            first, second = item.split(':')
+            pairs.append((float(first), float(second)))
+    except Exception:
+        return ()
+    pairs.sort(key=lambda x: x[0])
+    return tuple(pairs)
+
+
 def load_executor_settings() -> ExecutorSettings:
+    profit_tiers_csv = os.getenv(
+        "PROFIT_TIERS_CSV",
+        "5:0.10,8:0.10,13:0.10,21:0.10,34:0.10,55:0.10,89:0.10,144:0.10,233:0.10,377:0.10,610:0.10,987:0.10,1597:0.10"
+    )
+    trailing_zones_csv = os.getenv(
+        "TRAILING_ZONES_CSV",
+        "0:0.30,5:0.25,10:0.22,20:0.20,50:0.15,100:0.12,500:0.10,3000:0.08"
+    )
     return ExecutorSettings(
         # Wallet & RPC
         private_key=os.getenv("EXECUTOR_PRIVATE_KEY", ""),
@@ -106,14 +130,10 @@ def load_executor_settings() -> ExecutorSettings:
         runner_trailing_stop_pct=float(os.getenv("RUNNER_TRAILING_STOP_PCT", "0.30")),  # 30%
         
         # Extended scaling-out config (defaults designed for 3000x+ capability)
-        profit_tiers_csv=os.getenv(
-            "PROFIT_TIERS_CSV",
-            "5:0.10,8:0.10,13:0.10,21:0.10,34:0.10,55:0.10,89:0.10,144:0.10,233:0.10,377:0.10,610:0.10,987:0.10,1597:0.10"
-        ),
-        trailing_zones_csv=os.getenv(
-            "TRAILING_ZONES_CSV",
-            "0:0.30,5:0.25,10:0.22,20:0.20,50:0.15,100:0.12,500:0.10,3000:0.08"
-        ),
+        profit_tiers_csv=profit_tiers_csv,
+        trailing_zones_csv=trailing_zones_csv,
+        profit_tiers=_parse_pairs_csv(profit_tiers_csv),
+        trailing_zones=_parse_pairs_csv(trailing_zones_csv),
         min_runner_pct=float(os.getenv("MIN_RUNNER_PCT", "0.07")),  # Keep at least 7%
         partial_sell_cooldown_sec=int(os.getenv("PARTIAL_SELL_COOLDOWN_SEC", "180")),  # 3 minutes
         
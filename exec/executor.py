@@ -1,7 +1,12 @@
 import asyncio
 import logging
+import math
+import re
 import time
-from typing import Dict, Optional, Set
+from collections import deque
+from typing import Deque, Dict, Optional, Set
+
+import redis.asyncio as aioredis
 
 from .config import ExecutorSettings
 from .models import Position, PositionStatus, ExitReason, SignalData, TradeResult
@@ -16,6 +21,19 @@ from .order_manager import OrderManager
 from app.onchain import OnchainAnalyzer
 # EntryGates removed - your monitor system already provides excellent signal quality
 
+_SEEN_SIGNAL_IDS_MAX = 100_000
+_CONFIRM_CONCURRENCY = 64
+# Most recent closed trades kept in memory (positions are persisted by the idempotency store)
+_TRADE_RESULTS_MAX = 10_000
+# 10**decimals for every SPL token decimals value (a u8)
+_POW10 = tuple(10 ** i for i in range(256))
+# Jupiter quotes stay valid ~500ms; reuse one for retries within this window
+_QUOTE_CACHE_TTL_S = 0.3
+_QUOTE_CACHE_MAX = 256
+_QUOTE_BUCKET_LOG = math.log(1.01)
+# Rugcheck risk flags that block a buy, matched in one pass ("blacklist" also covers "blacklisted")
+_RISK_FLAGS_RE = re.compile(r"honeypot|blacklist|high_tax")
+
 
 class MemecoinExecutor:
     """Ultra-low latency memecoin execution engine"""
@@ -44,22 +62,35 @@ class MemecoinExecutor:
         self.jupiter = jupiter or JupiterClient(settings.jupiter_api_url)
         self.price_monitor = price_monitor or PriceMonitor(self.jupiter)
         self.risk_manager = RiskManager(settings)
+        # One Redis client (and connection pool) shared by the queue, idempotency and locks
+        redis_url = getattr(settings, 'redis_url', None)
+        self._redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
         # Require Redis Streams queue for production
         if signal_queue is not None:
             self.signal_queue = signal_queue
         else:
-            if not getattr(settings, 'redis_url', None):
+            if not redis_url:
                 raise ValueError("Redis URL is required for executor signal queue")
             self.signal_queue = RedisSignalQueue(
-                settings.redis_url,
+                redis_url,
                 settings.redis_stream_key,
                 settings.redis_consumer_group,
-                consumer="executor"
+                consumer="executor",
+                client=self._redis,
             )
         # Idempotency store
-        self.idempotency = idempotency or IdempotencyStore()
+        self.idempotency = idempotency or IdempotencyStore(
+            ttl_sec=settings.idempotency_ttl_sec,
+            redis=self._redis if settings.idempotency_backend == "redis" else None,
+        )
+        # With Redis idempotency on our own stream, claim and ack in a single script call
+        self._claim_with_ack = (
+            signal_queue is None and idempotency is None and settings.idempotency_backend == "redis"
+        )
+        # Signal ids already claimed by this process, answered without I/O (bounded, FIFO eviction)
+        self._seen_signal_ids: Dict[str, None] = {}
         # Order manager and locks
-        self.order_manager = order_manager or OrderManager(getattr(settings, 'redis_url', None))
+        self.order_manager = order_manager or OrderManager(redis_url, client=self._redis)
         
         # State tracking
         self.positions: Dict[str, Position] = {}
@@ -67,17 +98,21 @@ class MemecoinExecutor:
         self.is_running = False
         
         # Performance tracking
-        self.trade_results: list[TradeResult] = []
+        self.trade_results: Deque[TradeResult] = deque(maxlen=_TRADE_RESULTS_MAX)
         self.total_signals_processed = 0
         
         # Constants
         self.SOL_MINT = "So11111111111111111111111111111111111111112"
         self._cached_sol_usd: float | None = None
-        self._sol_price_last_fetch: float = 0.0
         # Provide portfolio value fetcher to risk manager
         self.risk_manager._account_value_fetcher = self._estimate_account_value
+        # (output mint, lamports bucket) -> (quote, monotonic fetch time)
+        self._quote_cache: Dict[tuple[str, int], tuple[dict, float]] = {}
         # Pre-trade onchain analyzer (lazy)
         self._pretrade_analyzer: OnchainAnalyzer | None = None
+        # Fire-and-forget tasks (confirms, persistence) held until done; confirms are capped
+        self._bg_tasks: Set[asyncio.Task] = set()
+        self._confirm_sem = asyncio.Semaphore(_CONFIRM_CONCURRENCY)
     
     async def start(self):
         """Start the executor engine"""
@@ -117,13 +152,23 @@ class MemecoinExecutor:
         
         logging.info(f"💰 Wallet balance: {balance:.3f} SOL")
         
+        # Pre-open Jupiter connections so the first quote skips DNS/TLS setup
+        await self.jupiter.warmup()
+        
+        # Pre-warm SOL/USD so the first trade does not wait on the refresher
+        try:
+            await self._refresh_sol_usd_price()
+        except Exception as e:
+            logging.warning(f"Initial SOL/USD fetch failed: {e}")
+        
         self.is_running = True
         
         # Start concurrent tasks
         tasks = [
             asyncio.create_task(self._signal_processor()),
             asyncio.create_task(self._position_manager()),
-            asyncio.create_task(self._maintenance_task())
+            asyncio.create_task(self._maintenance_task()),
+            asyncio.create_task(self._sol_price_refresher())
         ]
         
         try:
@@ -134,34 +179,50 @@ class MemecoinExecutor:
             self.is_running = False
             await self._cleanup()
     
+    def _spawn(self, coro) -> asyncio.Task:
+        """Start a background task and keep a reference until it finishes"""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._bg_tasks.discard)
+        return task
+    
     async def _signal_processor(self):
         """Process new signals and execute trades"""
         
         while self.is_running:
             try:
-                # Get new signals
-                # Redis queue returns list of (msg_id, SignalData)
-                new_signals = []
-                entries = await self.signal_queue.read_new()
-                for msg_id, signal in entries:
-                    new_signals.append((msg_id, signal))
-                
-                for msg_id, signal in new_signals:
-            # Idempotency check
-            sig_id = getattr(signal, 'signal_id', None) or f"{signal.ca}:{int(signal.first_seen_ts or signal.timestamp)}"
-            # Optional Redis idempotency could be added here guarded by settings.idempotency_backend
-            if await self.idempotency.has_processed(sig_id):
-                        if msg_id:
-                            await self.signal_queue.ack(msg_id)
-                        continue
-                    await self._process_signal(signal)
-                    await self.idempotency.mark_processed(sig_id)
-                    if msg_id:
-                        await self.signal_queue.ack(msg_id)
-                    self.last_processed_signal_time = max(self.last_processed_signal_time, signal.timestamp)
-                
-                await asyncio.sleep(0.1)  # 100ms loop for ultra-low latency
-                
+                # Redis queue returns list of (msg_id, SignalData); blocks until entries arrive
+                entries = await self.signal_queue.read_new(count=64, block_ms=1000)
+                if not entries:
+                    continue
+
+                # Idempotency: skip ids this process has already seen, then claim the
+                # rest in one round trip; only newly claimed signals are processed.
+                # Messages are acked up front since a claim already marks them processed.
+                seen = self._seen_signal_ids
+                sig_ids = [signal.dedupe_id for _msg_id, signal in entries]
+                to_claim = [(msg_id, sid) for (msg_id, _signal), sid in zip(entries, sig_ids) if sid not in seen]
+                if self._claim_with_ack:
+                    # Claims and XACK in one atomic Redis script call
+                    ack_only = [msg_id for (msg_id, _signal), sid in zip(entries, sig_ids) if sid in seen]
+                    claimed = await self.signal_queue.claim_and_ack(to_claim, ack_only, self.settings.idempotency_ttl_sec)
+                else:
+                    claimed = await self.idempotency.claim_many(sid for _msg_id, sid in to_claim)
+                    await self.signal_queue.ack_many([msg_id for msg_id, _signal in entries if msg_id])
+                for _msg_id, sid in to_claim:
+                    seen[sid] = None
+                while len(seen) > _SEEN_SIGNAL_IDS_MAX:
+                    del seen[next(iter(seen))]
+
+                latest_ts = self.last_processed_signal_time
+                for (_msg_id, signal), sig_id in zip(entries, sig_ids):
+                    if sig_id in claimed:
+                        claimed.discard(sig_id)
+                        await self._process_signal(signal)
+                        if signal.timestamp > latest_ts:
+                            latest_ts = signal.timestamp
+                self.last_processed_signal_time = latest_ts
+
             except Exception as e:
                 logging.error(f"Signal processor error: {e}")
                 await asyncio.sleep(1.0)
@@ -196,100 +257,123 @@ class MemecoinExecutor:
                 logging.info(f"⛔ Trade blocked: {signal.ca} - {reason}")
                 return
 
+            # Pre-trade rugcheck gates (pure string checks, before any await)
+            risk_hits = set(_RISK_FLAGS_RE.findall(signal.rugcheck_risks_lower))
+            if risk_hits - {"high_tax"}:
+                logging.info(f"🛑 Skip {signal.ca} due to rug flags: {signal.rugcheck_risks}")
+                return
+            # Optional: basic LP/tax sanity via rugcheck text if provided
+            if risk_hits:
+                logging.info(f"🛑 Skip {signal.ca} due to high tax flag")
+                return
+            
+            # Calculate position size ($10 base) and SOL amount needed using live SOL/USD
+            position_size_usd = self.settings.base_position_size_usd
+            sol_usd = self._get_sol_usd_price()
+            if not sol_usd or sol_usd <= 0:
+                logging.warning("⚠️  Could not fetch SOL/USD price")
+                return
+            sol_lamports = self.wallet.sol_to_lamports(position_size_usd / sol_usd)
+            
             # Token-level lock to prevent duplicates while order is running
-            lock_key = f"{signal.ca}:{getattr(signal, 'signal_id', '')}"
+            lock_key = signal.lock_key
             acquired = await self.order_manager.acquire_lock(lock_key, ttl_ms=120000)
             if not acquired:
                 logging.info(f"⛔ Duplicate lock active for {signal.ca}; skipping")
                 return
             try:
-                # Pre-trade micro-guard (non-blocking budget)
-                if getattr(self.settings, 'pretrade_onchain_guard', False):
-                    try:
-                        if self._pretrade_analyzer is None:
-                            # Use app config RPC defaults if available; fall back to executor RPC
-                            rpc_url = getattr(self.settings, 'rpc_url', None) or "https://api.mainnet-beta.solana.com"
-                            self._pretrade_analyzer = OnchainAnalyzer(rpc_url, timeout_ms=getattr(self.settings, 'pretrade_timeout_ms', 150))
-                        analysis = await asyncio.wait_for(self._pretrade_analyzer.analyze(signal.ca), timeout=(getattr(self.settings, 'pretrade_timeout_ms', 150)/1000.0))
-                    except Exception:
-                        analysis = None
-                    decision = True
-                    reason = "OK"
-                    if analysis:
-                        top1 = float(analysis.get('top1_pct', 0.0))
-                        top10 = float(analysis.get('top10_pct', 0.0))
-                        if top1 >= self.settings.pretrade_top1_max_pct or top10 >= self.settings.pretrade_top10_max_pct:
-                            decision = False
-                            reason = f"holder concentration top1={top1:.1f} top10={top10:.1f}"
-                    else:
-                        if str(getattr(self.settings, 'pretrade_fail_mode', 'soft')).lower() == 'hard':
-                            decision = False
-                            reason = "pretrade timeout"
-                    if not decision:
-                        logging.info(f"🛑 Pre-trade guard rejected {signal.ca}: {reason}")
-                        return
-                # Pre-trade rugcheck gates
-                risks_lower = (signal.rugcheck_risks or "").lower()
-                if any(flag in risks_lower for flag in ["honeypot", "blacklist", "blacklisted"]):
-                    logging.info(f"🛑 Skip {signal.ca} due to rug flags: {signal.rugcheck_risks}")
-                    return
-                # Optional: basic LP/tax sanity via rugcheck text if provided
-                if "high_tax" in risks_lower:
-                    logging.info(f"🛑 Skip {signal.ca} due to high tax flag")
-                    return
-                
-                # Calculate position size ($10 base)
-                position_size_usd = self.settings.base_position_size_usd
-                
-                # Execute buy
-                await self._execute_buy(signal, position_size_usd, tracker)
+                # Request the Jupiter quote now so it overlaps the pre-trade guard below
+                quote_task = asyncio.create_task(self._fetch_buy_quote(signal.ca, sol_lamports, tracker))
+                try:
+                    # Pre-trade micro-guard (non-blocking budget)
+                    if getattr(self.settings, 'pretrade_onchain_guard', False):
+                        try:
+                            if self._pretrade_analyzer is None:
+                                # Use app config RPC defaults if available; fall back to executor RPC
+                                rpc_url = getattr(self.settings, 'rpc_url', None) or "https://api.mainnet-beta.solana.com"
+                                self._pretrade_analyzer = OnchainAnalyzer(rpc_url, timeout_ms=getattr(self.settings, 'pretrade_timeout_ms', 150))
+                            analysis = await asyncio.wait_for(self._pretrade_analyzer.analyze(signal.ca), timeout=(getattr(self.settings, 'pretrade_timeout_ms', 150)/1000.0))
+                        except Exception:
+                            analysis = None
+                        decision = True
+                        reason = "OK"
+                        if analysis:
+                            top1 = float(analysis.get('top1_pct', 0.0))
+                            top10 = float(analysis.get('top10_pct', 0.0))
+                            if top1 >= self.settings.pretrade_top1_max_pct or top10 >= self.settings.pretrade_top10_max_pct:
+                                decision = False
+                                reason = f"holder concentration top1={top1:.1f} top10={top10:.1f}"
+                        else:
+                            if str(getattr(self.settings, 'pretrade_fail_mode', 'soft')).lower() == 'hard':
+                                decision = False
+                                reason = "pretrade timeout"
+                        if not decision:
+                            logging.info(f"🛑 Pre-trade guard rejected {signal.ca}: {reason}")
+                            return
+                    
+                    # Execute buy
+                    await self._execute_buy(signal, position_size_usd, sol_usd, quote_task, tracker)
+                finally:
+                    if not quote_task.done():
+                        quote_task.cancel()
             finally:
                 await self.order_manager.release_lock(lock_key)
             
         except Exception as e:
             logging.error(f"Signal processing error for {signal.ca}: {e}")
     
-    async def _execute_buy(self, signal: SignalData, size_usd: float, tracker: LatencyTracker):
-        """Execute buy order for signal"""
+    async def _fetch_buy_quote(self, ca: str, sol_lamports: int, tracker: LatencyTracker) -> Optional[dict]:
+        """Get a SOL -> ca quote from Jupiter, preferring direct routes"""
         
-        try:
-            logging.info(f"🎯 Executing buy: {signal.ca} for ${size_usd:.2f}")
-            # Robust signal id for persistence
-            sig_id = (getattr(signal, 'signal_id', None) or str(signal.timestamp))
-            
-            # Calculate SOL amount needed using live SOL/USD
-            sol_usd = await self._get_sol_usd_price()
-            if not sol_usd or sol_usd <= 0:
-                logging.warning("⚠️  Could not fetch SOL/USD price")
-                return
-            sol_amount = size_usd / sol_usd
-            sol_lamports = self.wallet.sol_to_lamports(sol_amount)
-            
-            # Get quote from Jupiter
-            tracker.mark_quote_requested()
-            ORDERS_STARTED.inc()
+        tracker.mark_quote_requested()
+        # Reuse a quote for the same mint and ~size (1% buckets) fetched moments ago
+        now = time.monotonic()
+        cache_key = (ca, int(math.log(max(sol_lamports, 1)) / _QUOTE_BUCKET_LOG))
+        cached = self._quote_cache.get(cache_key)
+        if cached and now - cached[1] < _QUOTE_CACHE_TTL_S:
+            tracker.mark_quote_received()
+            return cached[0]
+        
+        quote = await self.jupiter.get_quote(
+            input_mint=self.SOL_MINT,
+            output_mint=ca,
+            amount=sol_lamports,
+            slippage_bps=self.settings.max_slippage_bps,
+            only_direct=True
+        )
+        
+        if not quote:
+            # Fallback: allow non-direct routes
             quote = await self.jupiter.get_quote(
                 input_mint=self.SOL_MINT,
-                output_mint=signal.ca,
+                output_mint=ca,
                 amount=sol_lamports,
                 slippage_bps=self.settings.max_slippage_bps,
-                only_direct=True
+                only_direct=False
             )
+        if quote:
+            tracker.mark_quote_received()
+            if len(self._quote_cache) >= _QUOTE_CACHE_MAX:
+                self._quote_cache = {k: v for k, v in self._quote_cache.items() if now - v[1] < _QUOTE_CACHE_TTL_S}
+            self._quote_cache[cache_key] = (quote, now)
+        return quote
+    
+    async def _execute_buy(self, signal: SignalData, size_usd: float, sol_usd: float, quote_task: "asyncio.Task", tracker: LatencyTracker):
+        """Execute buy order for signal using the quote requested in _process_signal"""
+        
+        # Hot-path state transitions are buffered and persisted off the critical path
+        transitions: list[tuple[str, str, str, float]] = []
+        try:
+            logging.info(f"🎯 Executing buy: {signal.ca} for ${size_usd:.2f}")
+            # Robust signal id for persistence
+            sig_id = (getattr(signal, 'signal_id', None) or str(signal.timestamp))
             
+            ORDERS_STARTED.inc()
+            quote = await quote_task
             if not quote:
-                # Fallback: allow non-direct routes
-                quote = await self.jupiter.get_quote(
-                    input_mint=self.SOL_MINT,
-                    output_mint=signal.ca,
-                    amount=sol_lamports,
-                    slippage_bps=self.settings.max_slippage_bps,
-                    only_direct=False
-                )
-                if not quote:
-                    logging.warning(f"❌ No quote for {signal.ca}")
-                    return
-            tracker.mark_quote_received()
-            await self.idempotency.record_transition(sig_id, signal.ca, "QUOTED")
+                logging.warning(f"❌ No quote for {signal.ca}")
+                return
+            transitions.append((sig_id, signal.ca, "QUOTED", time.time()))
             
             # Validate quote
             is_valid, validation_msg = self.jupiter.validate_quote_for_memecoin(
@@ -315,17 +399,19 @@ class MemecoinExecutor:
             if tracker.hot_path_ms_so_far() > 100.0:
                 ORDERS_ABORTED_LATENCY.inc()
                 logging.error(f"Latency gate abort for {signal.ca}: {tracker.hot_path_ms_so_far():.1f}ms > 100ms")
-                await self.idempotency.record_transition(sig_id, signal.ca, "FAILED")
+                transitions.append((sig_id, signal.ca, "FAILED", time.time()))
                 return
 
             # Sign with EphemeralSigner
             signed_b64 = self.signer.sign_b64(swap_transaction)
             tracker.mark_signed()
-            await self.idempotency.record_transition(sig_id, signal.ca, "SIGNED")
+            transitions.append((sig_id, signal.ca, "SIGNED", time.time()))
             # Submit
             # Submit via wallet
             signature = await self.wallet.send_signed_transaction(signed_b64)
             tracker.mark_submitted()
+            self._spawn(self.idempotency.record_transitions_bulk(transitions.copy()))
+            transitions.clear()
             
             if not signature:
                 logging.error(f"❌ Failed to send transaction for {signal.ca}")
@@ -344,7 +430,7 @@ class MemecoinExecutor:
                     out_decimals = int(token_info['decimals'])
             except Exception:
                 pass
-            out_tokens_ui = out_amount / (10 ** out_decimals)
+            out_tokens_ui = out_amount / _POW10[out_decimals]
             entry_price = in_usd / out_tokens_ui if out_tokens_ui > 0 else 0
             
             # Create position
@@ -385,15 +471,19 @@ class MemecoinExecutor:
                         f"Tokens: {out_amount:.0f} | Stop: ${position.stop_loss_price:.8f}")
             
             # Confirm transaction in background
-            asyncio.create_task(self._confirm_transaction(signature, position, tracker))
+            self._spawn(self._confirm_transaction(signature, position, tracker))
             
         except Exception as e:
             logging.error(f"Buy execution error for {signal.ca}: {e}")
+        finally:
+            if transitions:
+                self._spawn(self.idempotency.record_transitions_bulk(transitions))
     
     async def _confirm_transaction(self, signature: str, position: Position, tracker: LatencyTracker):
         """Confirm transaction and handle failures"""
         
-        confirmed = await self.wallet.confirm_transaction(signature, timeout_seconds=30.0)
+        async with self._confirm_sem:
+            confirmed = await self.wallet.confirm_transaction(signature, timeout_seconds=30.0)
         
         if not confirmed:
             logging.warning(f"⚠️  Transaction not confirmed: {signature}")
@@ -430,23 +520,22 @@ class MemecoinExecutor:
                     await asyncio.sleep(1.0)
                     continue
                 
-                # Check each position
-                positions_to_remove = []
-                
-                for ca, position in self.positions.items():
-                    try:
-                        await self._manage_position(position)
-                        
-                        if position.status != PositionStatus.ACTIVE:
-                            positions_to_remove.append(ca)
-                            
-                    except Exception as e:
-                        logging.error(f"Position management error for {ca}: {e}")
+                # Check each position against prices fetched in one batch. Positions are
+                # managed concurrently so one slow sell or near-stop recheck doesn't hold up the rest
+                snapshot = list(self.positions.items())
+                prices = await self.price_monitor.get_current_prices([ca for ca, _position in snapshot])
+                results = await asyncio.gather(
+                    *(self._manage_position(position, prices.get(ca)) for ca, position in snapshot),
+                    return_exceptions=True,
+                )
                 
-                # Remove completed positions
-                for ca in positions_to_remove:
-                    del self.positions[ca]
-                    self.risk_manager.portfolio_stats.active_positions -= 1
+                for (ca, position), result in zip(snapshot, results):
+                    if isinstance(result, Exception):
+                        logging.error(f"Position management error for {ca}: {result}")
+                    # Remove completed positions; a failed confirmation may already have dropped it
+                    if position.status != PositionStatus.ACTIVE and self.positions.get(ca) is position:
+                        del self.positions[ca]
+                        self.risk_manager.portfolio_stats.active_positions -= 1
                 
                 # Sleep based on interval setting
                 interval_seconds = self.settings.price_check_interval_ms / 1000.0
@@ -456,13 +545,10 @@ class MemecoinExecutor:
                 logging.error(f"Position manager error: {e}")
                 await asyncio.sleep(5.0)
     
-    async def _manage_position(self, position: Position):
-        """Manage individual position"""
+    async def _manage_position(self, position: Position, current_price: Optional[float]):
+        """Manage individual position at its current price"""
         
         try:
-            # Get current price
-            current_price = await self.price_monitor.get_current_price(position.ca)
-            
             if current_price is None:
                 logging.warning(f"⚠️  Cannot get price for {position.ca}")
                 return
@@ -510,7 +596,6 @@ class MemecoinExecutor:
             current_multiple = current_price / position.entry_price
             tokens_to_sell = position.remaining_tokens * sell_percentage
             # Guard against tiny amounts due to decimals/rounding
-            token_decimals = getattr(position, 'token_decimals', 9)
             min_atomic = 1  # smallest on-chain unit
             if int(tokens_to_sell) < min_atomic and sell_percentage < 1.0:
                 logging.info(f"⏭️  Skipping tiny partial for {position.ca} (amount too small)")
@@ -563,7 +648,7 @@ class MemecoinExecutor:
                 # Calculate P&L for this sell
                 in_amount, out_amount, _ = self.jupiter.calculate_impact_and_amounts(quote)
                 sol_received = out_amount / 1e9
-                sol_usd = await self._get_sol_usd_price()
+                sol_usd = self._get_sol_usd_price()
                 sol_value_usd = sol_received * (sol_usd or 0)
                 
                 if sell_percentage == 1.0:
@@ -631,26 +716,35 @@ class MemecoinExecutor:
         except Exception as e:
             logging.error(f"Sell execution error for {position.ca}: {e}")
 
-    async def _get_sol_usd_price(self) -> Optional[float]:
-        """Fetch and cache SOL/USD using Jupiter price API."""
-        now = time.time()
-        if self._cached_sol_usd and now - self._sol_price_last_fetch < 10:
-            return self._cached_sol_usd
-        # Jupiter price API expects mint; use SOL_MINT
-        price = await self.price_monitor.get_current_price(self.SOL_MINT)
+    def _get_sol_usd_price(self) -> Optional[float]:
+        """Latest SOL/USD, kept fresh by _sol_price_refresher (no I/O on the hot path)."""
+        return self._cached_sol_usd
+
+    async def _refresh_sol_usd_price(self) -> None:
+        """Fetch SOL/USD from Jupiter price API and cache it."""
+        # Jupiter price API expects mint; use SOL_MINT. Goes straight to Jupiter so the
+        # position price cache never holds or serves SOL/USD
+        price = await self.jupiter.get_price(self.SOL_MINT)
         if price:
             self._cached_sol_usd = price
-            self._sol_price_last_fetch = now
-        return self._cached_sol_usd
+
+    async def _sol_price_refresher(self):
+        """Refresh SOL/USD every second in the background"""
+        
+        while self.is_running:
+            await asyncio.sleep(1.0)
+            try:
+                await self._refresh_sol_usd_price()
+            except Exception as e:
+                logging.debug(f"SOL/USD refresh failed: {e}")
 
     def _estimate_account_value(self) -> float:
         """Estimate account value: MTM of positions (USD). Conservative, synchronous."""
         try:
-            total_positions_value = 0.0
-            for pos in self.positions.values():
-                current_price = pos.peak_price or pos.entry_price
-                remaining_ui = pos.remaining_tokens / (10 ** getattr(pos, 'token_decimals', 9))
-                total_positions_value += remaining_ui * current_price
+            total_positions_value = sum(
+                pos.remaining_tokens * pos.ui_scale * (pos.peak_price or pos.entry_price)
+                for pos in self.positions.values()
+            )
             baseline = 1000.0
             return max(baseline, total_positions_value)
         except Exception:
@@ -687,6 +781,7 @@ class MemecoinExecutor:
             total_unrealized = sum(
                 (pos.peak_price - pos.entry_price) / pos.entry_price * pos.size_usd
                 for pos in self.positions.values()
+                if pos.entry_price > 0
             )
             
             logging.info(f"📊 Portfolio: {len(self.positions)} active positions | "
@@ -698,9 +793,16 @@ class MemecoinExecutor:
         
         logging.info("🧹 Cleaning up executor...")
         
+        # Let in-flight confirmations (30s timeout) and persistence finish
+        if self._bg_tasks:
+            await asyncio.wait(list(self._bg_tasks), timeout=35.0)
+        
         try:
             await self.wallet.close()
             await self.jupiter.close()
+            await self.idempotency.close()
+            if self._redis:
+                await self._redis.aclose()
         except Exception as e:
             logging.error(f"Cleanup error: {e}")
         
@@ -741,6 +843,14 @@ async def main():
 
 
 if __name__ == "__main__":
+    import os
     import sys
+    # Optional faster event loop on POSIX
+    if os.name != "nt":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
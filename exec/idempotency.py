@@ -1,148 +1,190 @@
 import asyncio
 import sqlite3
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Iterable, Optional, Sequence, Set, Tuple
+
+import redis.asyncio as aioredis
+
+# Redis key prefix for processed-signal claims (shared with RedisSignalQueue.claim_and_ack)
+IDEM_KEY_PREFIX = "idem:"
 
 
 class IdempotencyStore:
     """SQLite-backed idempotency and state store.
 
     Guarantees we process a signal_id at most once. Safe for single-writer process.
+    All SQLite work runs on one persistent WAL connection owned by a dedicated thread,
+    so awaiting callers never block the event loop on disk I/O.
+    When redis_url (or a shared redis client) is given, processed-signal claims use Redis SET NX with a TTL instead
+    of the processed_signals table; order state stays in SQLite.
     """
 
-    def __init__(self, db_path: str = "data/executor_state.db"):
+    def __init__(
+        self,
+        db_path: str = "data/executor_state.db",
+        redis_url: Optional[str] = None,
+        ttl_sec: int = 172800,
+        redis: Optional[aioredis.Redis] = None,
+    ):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
-        self._lock = asyncio.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="idempotency-db")
+        self._db = self._open_db()
+        self._owns_redis = redis is None
+        if redis is not None:
+            self._redis = redis
+        else:
+            self._redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
+        self._ttl_sec = ttl_sec
 
-    def _init_db(self) -> None:
-        con = sqlite3.connect(self.db_path)
-        try:
-            cur = con.cursor()
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS processed_signals (
-                    signal_id TEXT PRIMARY KEY,
-                    processed_at REAL NOT NULL
-                )
-                """
+    def _open_db(self) -> sqlite3.Connection:
+        db = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("PRAGMA busy_timeout=5000")
+        db.execute("PRAGMA temp_store=MEMORY")
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS processed_signals (
+                signal_id TEXT PRIMARY KEY,
+                processed_at REAL NOT NULL
             )
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS order_transitions (
-                    signal_id TEXT NOT NULL,
-                    mint TEXT NOT NULL,
-                    state TEXT NOT NULL,
-                    ts REAL NOT NULL,
-                    PRIMARY KEY (signal_id, state)
-                )
-                """
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS order_transitions (
+                signal_id TEXT NOT NULL,
+                mint TEXT NOT NULL,
+                state TEXT NOT NULL,
+                ts REAL NOT NULL,
+                PRIMARY KEY (signal_id, state)
             )
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS exits (
-                    signal_id TEXT NOT NULL,
-                    mint TEXT NOT NULL,
-                    pct REAL NOT NULL,
-                    ts REAL NOT NULL
-                )
-                """
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS exits (
+                signal_id TEXT NOT NULL,
+                mint TEXT NOT NULL,
+                pct REAL NOT NULL,
+                ts REAL NOT NULL
             )
-            cur.execute(
-                """
-                CREATE TABLE IF NOT EXISTS positions (
-                    signal_id TEXT PRIMARY KEY,
-                    mint TEXT NOT NULL,
-                    entry_signature TEXT,
-                    entry_time REAL,
-                    size_usd REAL,
-                    size_tokens REAL,
-                    token_decimals INTEGER,
-                    entry_price REAL,
-                    status TEXT
-                )
-                """
+            """
+        )
+        db.execute(
+            """
+            CREATE TABLE IF NOT EXISTS positions (
+                signal_id TEXT PRIMARY KEY,
+                mint TEXT NOT NULL,
+                entry_signature TEXT,
+                entry_time REAL,
+                size_usd REAL,
+                size_tokens REAL,
+                token_decimals INTEGER,
+                entry_price REAL,
+                status TEXT
             )
-            con.commit()
-        finally:
-            con.close()
+            """
+        )
+        return db
 
-    async def has_processed(self, signal_id: str) -> bool:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            try:
-                cur = con.cursor()
-                cur.execute("SELECT 1 FROM processed_signals WHERE signal_id=?", (signal_id,))
-                row = cur.fetchone()
-                return row is not None
-            finally:
-                con.close()
-
-    async def mark_processed(self, signal_id: str) -> None:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            try:
-                cur = con.cursor()
-                cur.execute(
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> None:
+        self._db.execute(sql, params)
+
+    def _fetchone(self, sql: str, params: Sequence[Any] = ()) -> Optional[tuple]:
+        return self._db.execute(sql, params).fetchone()
+
+    def _executemany(self, sql: str, rows: Sequence[Sequence[Any]]) -> None:
+        db = self._db
+        db.execute("BEGIN")
+        try:
+            db.executemany(sql, rows)
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+
+    def _claim_sqlite(self, ids: Sequence[str]) -> Set[str]:
+        db = self._db
+        now = time.time()
+        claimed: Set[str] = set()
+        db.execute("BEGIN")
+        try:
+            for sid in ids:
+                cur = db.execute(
                     "INSERT OR IGNORE INTO processed_signals(signal_id, processed_at) VALUES (?, ?)",
-                    (signal_id, time.time()),
+                    (sid, now),
                 )
-                con.commit()
-            finally:
-                con.close()
+                if cur.rowcount:
+                    claimed.add(sid)
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        return claimed
+
+    def _load_positions_by_status(self, status: str) -> list[dict]:
+        cur = self._db.execute("SELECT * FROM positions WHERE status=?", (status,))
+        cols = [d[0] for d in cur.description]
+        return [dict(zip(cols, row)) for row in cur.fetchall()]
+
+    async def claim_many(self, signal_ids: Iterable[str]) -> Set[str]:
+        """Mark signal_ids processed and return the ones newly claimed by this call.
+
+        The claim is the dedupe check: an id already processed is simply not returned.
+        """
+        ids = list(dict.fromkeys(signal_ids))
+        if not ids:
+            return set()
+        if self._redis:
+            pipe = self._redis.pipeline(transaction=False)
+            for sid in ids:
+                pipe.set(f"{IDEM_KEY_PREFIX}{sid}", "1", nx=True, ex=self._ttl_sec)
+            results = await pipe.execute()
+            return {sid for sid, ok in zip(ids, results) if ok}
+        return await self._run(self._claim_sqlite, ids)
 
     async def record_transition(self, signal_id: str, mint: str, state: str) -> None:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            try:
-                cur = con.cursor()
-                cur.execute(
-                    "INSERT OR REPLACE INTO order_transitions(signal_id, mint, state, ts) VALUES (?, ?, ?, ?)",
-                    (signal_id, mint, state, time.time()),
-                )
-                con.commit()
-            finally:
-                con.close()
+        await self._run(
+            self._execute,
+            "INSERT OR REPLACE INTO order_transitions(signal_id, mint, state, ts) VALUES (?, ?, ?, ?)",
+            (signal_id, mint, state, time.time()),
+        )
+
+    async def record_transitions_bulk(self, rows: Sequence[Tuple[str, str, str, float]]) -> None:
+        """Record (signal_id, mint, state, ts) transitions in a single transaction."""
+        if not rows:
+            return
+        await self._run(
+            self._executemany,
+            "INSERT OR REPLACE INTO order_transitions(signal_id, mint, state, ts) VALUES (?, ?, ?, ?)",
+            list(rows),
+        )
 
     async def last_state(self, signal_id: str) -> Optional[str]:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            try:
-                cur = con.cursor()
-                cur.execute(
-                    "SELECT state FROM order_transitions WHERE signal_id=? ORDER BY ts DESC LIMIT 1",
-                    (signal_id,),
-                )
-                row = cur.fetchone()
-                return row[0] if row else None
-            finally:
-                con.close()
+        row = await self._run(
+            self._fetchone,
+            "SELECT state FROM order_transitions WHERE signal_id=? ORDER BY ts DESC LIMIT 1",
+            (signal_id,),
+        )
+        return row[0] if row else None
 
     async def record_exit(self, signal_id: str, mint: str, pct: float) -> None:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            try:
-                cur = con.cursor()
-                cur.execute(
-                    "INSERT INTO exits(signal_id, mint, pct, ts) VALUES (?, ?, ?, ?)",
-                    (signal_id, mint, pct, time.time()),
-                )
-                con.commit()
-            finally:
-                con.close()
+        await self._run(
+            self._execute,
+            "INSERT INTO exits(signal_id, mint, pct, ts) VALUES (?, ?, ?, ?)",
+            (signal_id, mint, pct, time.time()),
+        )
 
     async def get_executed_exit_pct(self, signal_id: str) -> float:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            try:
-                cur = con.cursor()
-                cur.execute("SELECT COALESCE(SUM(pct),0) FROM exits WHERE signal_id=?", (signal_id,))
-                row = cur.fetchone()
-                return float(row[0] or 0.0)
-            finally:
-                con.close()
+        row = await self._run(self._fetchone, "SELECT COALESCE(SUM(pct),0) FROM exits WHERE signal_id=?", (signal_id,))
+        return float(row[0] or 0.0)
 
     async def upsert_position(
         self,
@@ -156,50 +198,45 @@ class IdempotencyStore:
         entry_price: float | None,
         status: str | None,
     ) -> None:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            try:
-                cur = con.cursor()
-                cur.execute(
-                    """
-                    INSERT INTO positions(signal_id, mint, entry_signature, entry_time, size_usd, size_tokens, token_decimals, entry_price, status)
-                    VALUES(?,?,?,?,?,?,?,?,?)
-                    ON CONFLICT(signal_id) DO UPDATE SET
-                        mint=excluded.mint,
-                        entry_signature=COALESCE(excluded.entry_signature, positions.entry_signature),
-                        entry_time=COALESCE(excluded.entry_time, positions.entry_time),
-                        size_usd=COALESCE(excluded.size_usd, positions.size_usd),
-                        size_tokens=COALESCE(excluded.size_tokens, positions.size_tokens),
-                        token_decimals=COALESCE(excluded.token_decimals, positions.token_decimals),
-                        entry_price=COALESCE(excluded.entry_price, positions.entry_price),
-                        status=COALESCE(excluded.status, positions.status)
-                    """,
-                    (
-                        signal_id,
-                        mint,
-                        entry_signature,
-                        entry_time,
-                        size_usd,
-                        size_tokens,
-                        token_decimals,
-                        entry_price,
-                        status,
-                    ),
-                )
-                con.commit()
-            finally:
-                con.close()
+        await self._run(
+            self._execute,
+            """
+            INSERT INTO positions(signal_id, mint, entry_signature, entry_time, size_usd, size_tokens, token_decimals, entry_price, status)
+            VALUES(?,?,?,?,?,?,?,?,?)
+            ON CONFLICT(signal_id) DO UPDATE SET
+                mint=excluded.mint,
+                entry_signature=COALESCE(excluded.entry_signature, positions.entry_signature),
+                entry_time=COALESCE(excluded.entry_time, positions.entry_time),
+                size_usd=COALESCE(excluded.size_usd, positions.size_usd),
+                size_tokens=COALESCE(excluded.size_tokens, positions.size_tokens),
+                token_decimals=COALESCE(excluded.token_decimals, positions.token_decimals),
+                entry_price=COALESCE(excluded.entry_price, positions.entry_price),
+                status=COALESCE(excluded.status, positions.status)
+            """,
+            (
+                signal_id,
+                mint,
+                entry_signature,
+                entry_time,
+                size_usd,
+                size_tokens,
+                token_decimals,
+                entry_price,
+                status,
+            ),
+        )
 
     async def load_positions_by_status(self, status: str) -> list[dict]:
-        async with self._lock:
-            con = sqlite3.connect(self.db_path)
-            con.row_factory = sqlite3.Row
-            try:
-                cur = con.cursor()
-                cur.execute("SELECT * FROM positions WHERE status=?", (status,))
-                rows = cur.fetchall()
-                return [dict(r) for r in rows]
-            finally:
-                con.close()
-
+        return await self._run(self._load_positions_by_status, status)
 
+    async def close(self) -> None:
+        if self._redis and self._owns_redis:
+            try:
+                await self._redis.aclose()
+            except Exception:
+                pass
+        try:
+            await self._run(self._db.close)
+        except Exception:
+            pass
+        self._pool.shutdown(wait=False)
@@ -1,10 +1,14 @@
 import asyncio
 import aiohttp
-import json
 import logging
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import base64
 
+import orjson
+
+# Price API v2 accepts up to 100 comma-separated mints per request
+_PRICE_BATCH_MAX = 100
+
 
 class JupiterClient:
     """Ultra-fast Jupiter API client optimized for memecoin execution"""
@@ -13,11 +17,12 @@ class JupiterClient:
         self.api_url = api_url.rstrip('/')
         self.session: Optional[aiohttp.ClientSession] = None
         
-        # Connection pooling for speed
+        # Connection pooling for speed; keep idle connections and DNS answers warm between trades
         self.connector = aiohttp.TCPConnector(
             limit=100,
             limit_per_host=50,
-            keepalive_timeout=30,
+            keepalive_timeout=300,
+            ttl_dns_cache=300,
             enable_cleanup_closed=True
         )
         
@@ -47,6 +52,18 @@ class JupiterClient:
         if self.session and not self.session.closed:
             await self.session.close()
     
+    async def warmup(self) -> None:
+        """Open pooled connections (DNS + TLS) to the quote and price hosts ahead of the first trade"""
+        
+        try:
+            session = await self._get_session()
+            # Any response will do; the point is the established keep-alive connection
+            for url in (f"{self.api_url}/quote", "https://api.jup.ag/price/v2"):
+                async with session.get(url) as response:
+                    await response.read()
+        except Exception as e:
+            logging.debug(f"Jupiter warmup failed: {e}")
+    
     async def get_quote(
         self, 
         input_mint: str,
@@ -73,7 +90,7 @@ class JupiterClient:
             
             async with session.get(url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     # Jupiter v6 returns { "data": [ { inAmount, outAmount, priceImpactPct, ... } ] }
                     routes = data.get('data') if isinstance(data, dict) else None
                     if isinstance(routes, list) and routes:
@@ -116,9 +133,9 @@ class JupiterClient:
             
             url = f"{self.api_url}/swap"
             
-            async with session.post(url, json=swap_request) as response:
+            async with session.post(url, data=orjson.dumps(swap_request)) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     return data.get('swapTransaction')
                 else:
                     error_text = await response.text()
@@ -140,7 +157,7 @@ class JupiterClient:
             params = {'mints': mint_address}
             async with session.get(url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
+                    data = orjson.loads(await response.read())
                     price_data = data.get('data', {}).get(mint_address)
                     if price_data and 'price' in price_data:
                         return float(price_data['price'])
@@ -148,7 +165,7 @@ class JupiterClient:
             params = {'ids': 'SOL' if mint_address == 'So11111111111111111111111111111111111111112' else mint_address}
             async with session.get(url, params=params) as response2:
                 if response2.status == 200:
-                    data2 = await response2.json()
+                    data2 = orjson.loads(await response2.read())
                     key = params['ids']
                     price_data2 = data2.get('data', {}).get(key)
                     if price_data2 and 'price' in price_data2:
@@ -159,6 +176,38 @@ class JupiterClient:
             logging.debug(f"Price fetch failed for {mint_address}: {e}")
             return None
     
+    async def get_prices(self, mint_addresses: List[str]) -> Dict[str, float]:
+        """Get current prices for many tokens in one price API v2 request per 100 mints"""
+        
+        prices: Dict[str, float] = {}
+        if not mint_addresses:
+            return prices
+        session = await self._get_session()
+        url = "https://api.jup.ag/price/v2"
+        for i in range(0, len(mint_addresses), _PRICE_BATCH_MAX):
+            chunk = mint_addresses[i:i + _PRICE_BATCH_MAX]
+            # A failed chunk only loses its own mints, which fall back below
+            try:
+                async with session.get(url, params={'mints': ','.join(chunk)}) as response:
+                    if response.status != 200:
+                        continue
+                    data = orjson.loads(await response.read()).get('data') or {}
+            except Exception as e:
+                logging.debug(f"Batch price fetch failed for {len(chunk)} mints: {e}")
+                continue
+            for mint in chunk:
+                price_data = data.get(mint)
+                if price_data and price_data.get('price') is not None:
+                    prices[mint] = float(price_data['price'])
+        
+        # Mints the batch didn't price go through get_price, which also tries the ids= form
+        missing = [mint for mint in mint_addresses if mint not in prices]
+        if missing:
+            for mint, price in zip(missing, await asyncio.gather(*(self.get_price(m) for m in missing))):
+                if price is not None:
+                    prices[mint] = price
+        return prices
+    
     def calculate_impact_and_amounts(self, quote: Dict[str, Any]) -> tuple[float, float, float]:
         """Extract key info from quote for decision making"""
         
@@ -213,26 +262,28 @@ class PriceMonitor:
         self._price_cache: Dict[str, tuple[float, float]] = {}  # mint -> (price, timestamp)
         self._cache_ttl = 5.0  # 5 second cache
     
-    async def get_current_price(self, mint_address: str, use_cache: bool = True) -> Optional[float]:
-        """Get current price with optional caching"""
+    async def get_current_prices(self, mint_addresses: List[str], use_cache: bool = True) -> Dict[str, float]:
+        """Get current prices for many mints, fetching cache misses in one batch"""
         
         import time
         now = time.time()
         
-        # Check cache first
-        if use_cache and mint_address in self._price_cache:
-            cached_price, cached_time = self._price_cache[mint_address]
-            if now - cached_time < self._cache_ttl:
-                return cached_price
-        
-        # Fetch fresh price
-        price = await self.jupiter.get_price(mint_address)
+        prices: Dict[str, float] = {}
+        missing: List[str] = []
+        for mint in mint_addresses:
+            cached = self._price_cache.get(mint) if use_cache else None
+            if cached is not None and now - cached[1] < self._cache_ttl:
+                prices[mint] = cached[0]
+            else:
+                missing.append(mint)
         
-        # Update cache
-        if price is not None:
-            self._price_cache[mint_address] = (price, now)
+        if missing:
+            fetched = await self.jupiter.get_prices(missing)
+            for mint, price in fetched.items():
+                self._price_cache[mint] = (price, now)
+            prices.update(fetched)
         
-        return price
+        return prices
     
     def clear_cache(self):
         """Clear price cache"""
@@ -19,7 +19,7 @@ class ExitReason(Enum):
     RUG_DETECTED = "rug_detected"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     ca: str
     entry_price: float  # Stored in USD/token
@@ -62,8 +62,11 @@ class Position:
 
     # Token metadata
     token_decimals: int = 9
+    # Atomic units -> UI amount multiplier, 1 / 10**token_decimals (set once in __post_init__)
+    ui_scale: float = field(init=False, repr=False)
     
     def __post_init__(self):
+        self.ui_scale = 1.0 / (10 ** self.token_decimals)
         if self.remaining_tokens == 0.0:
             self.remaining_tokens = self.size_tokens
         if self.peak_price == 0.0:
@@ -72,7 +75,7 @@ class Position:
             self.last_price_check = time.time()
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeResult:
     ca: str
     entry_time: float
@@ -119,7 +122,7 @@ class PortfolioStats:
         return hours_since_reset >= 24  # Reset after 24 hours
 
 
-@dataclass 
+@dataclass(slots=True)
 class SignalData:
     """Fast signal data structure from monitor"""
     ca: str
@@ -137,3 +140,13 @@ class SignalData:
     quality_score: float = 0.0
     # Optional unique id for idempotency (e.g., sha1 of ca+first_seen/timestamp)
     signal_id: Optional[str] = None
+    # Derived keys, computed once at construction (signal_id is passed in, never set later)
+    dedupe_id: str = field(init=False, repr=False)
+    lock_key: str = field(init=False, repr=False)
+    # Lowercased rugcheck risks for flag matching, computed at decode time
+    rugcheck_risks_lower: str = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self.rugcheck_risks_lower = (self.rugcheck_risks or "").lower()
+        self.dedupe_id = self.signal_id or f"{self.ca}:{int(self.first_seen_ts or self.timestamp)}"
+        self.lock_key = f"{self.ca}:{self.signal_id or ''}"
@@ -109,20 +109,7 @@ async def _consume_intents(self) -> None:
         ev = await self._intent_queue.get()
         try:
             # Your existing recording
-            await self.recorder.record_trade_intent(
-                ts=ev.ts,
-                ca=ev.ca,
-                kind=ev.kind,
-                ug_fast=ev.ug_fast,
-                ug_slow=ev.ug_slow,
-                velocity_mpm=ev.velocity_mpm,
-                first_seen_ts=ev.first_seen_ts,
-                last_seen_ts=ev.last_seen_ts,
-                rc_score=ev.rc_score,
-                rc_risk_text=ev.rc_risk_text,
-                rc_lp_text=ev.rc_lp_text,
-                rc_upd_short=ev.rc_upd_short,
-            )
+            await self.recorder.record_event("trade_intents", ev)
             
             # NEW: Send to executor for auto-trading
             await self.executor_bridge.send_trade_intent(ev)
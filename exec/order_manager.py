@@ -35,8 +35,11 @@ class OrderManager:
     Full SQLite persistence of transitions can be added by integrating with the idempotency DB.
     """
 
-    def __init__(self, redis_url: Optional[str]):
-        self._redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
+    def __init__(self, redis_url: Optional[str], client: Optional[aioredis.Redis] = None):
+        if client is not None:
+            self._redis = client
+        else:
+            self._redis = aioredis.from_url(redis_url, decode_responses=True) if redis_url else None
 
     async def acquire_lock(self, key: str, ttl_ms: int = 30000) -> bool:
         if not self._redis:
@@ -2,34 +2,62 @@ import asyncio
 import json
 import logging
 import time
-from typing import List, Optional, Tuple
+from typing import List, Optional, Set, Tuple
 
 import redis.asyncio as aioredis
 
+from .idempotency import IDEM_KEY_PREFIX
 from .models import SignalData
 
+# Claim each signal id (SET NX EX) and XACK every message in one atomic call.
+# KEYS[1] = stream, KEYS[2..n+1] = idempotency keys of the messages to claim;
+# ARGV[1] = group, ARGV[2] = ttl, ARGV[3..n+2] = their message ids, ARGV[n+3..] = ack-only ids.
+# Returns the 1-based positions of the claims that were newly set.
+_CLAIM_AND_ACK_LUA = """
+local n = #KEYS - 1
+local claimed = {}
+for i = 1, n do
+    if redis.call('SET', KEYS[i + 1], '1', 'NX', 'EX', ARGV[2]) then
+        claimed[#claimed + 1] = i
+    end
+end
+if #ARGV > 2 then
+    redis.call('XACK', KEYS[1], ARGV[1], unpack(ARGV, 3))
+end
+return claimed
+"""
+
 
 class RedisSignalQueue:
     """Redis Streams-backed signal queue compatible with FastSignalQueue API.
 
     Methods used by the codebase:
       - read_new() -> list[(msg_id, SignalData)]
-      - ack(msg_id: str) -> None
+      - ack_many(msg_ids: list[str]) -> None
+      - claim_and_ack(to_claim, ack_only, ttl_sec) -> set[str]
       - cleanup_old_signals(max_age_hours: float) -> None
 
     Producer-side put is not used by the executor directly, but is handy for tests/integration.
     """
 
-    def __init__(self, redis_url: str, stream_key: str, consumer_group: str, consumer: str):
-        self._redis = aioredis.from_url(redis_url, decode_responses=True)
+    def __init__(self, redis_url: str, stream_key: str, consumer_group: str, consumer: str, client: Optional[aioredis.Redis] = None):
+        # A shared client (decode_responses=True) is owned, and closed, by whoever passed it in
+        self._owns_client = client is None
+        self._redis = client if client is not None else aioredis.from_url(redis_url, decode_responses=True)
         self.stream_key = stream_key
         self.consumer_group = consumer_group
         self.consumer = consumer
         self._ensure_group_lock = asyncio.Lock()
+        self._group_ready = False
+        self._claim_and_ack = self._redis.register_script(_CLAIM_AND_ACK_LUA)
 
     async def _ensure_group(self) -> None:
         """Create the stream and consumer group if they do not exist."""
+        if self._group_ready:
+            return
         async with self._ensure_group_lock:
+            if self._group_ready:
+                return
             try:
                 # Create stream with an empty entry if it does not exist
                 exists = await self._redis.exists(self.stream_key)
@@ -41,9 +69,12 @@ class RedisSignalQueue:
                 # Create consumer group if missing
                 try:
                     await self._redis.xgroup_create(name=self.stream_key, groupname=self.consumer_group, id="$", mkstream=True)
+                    self._group_ready = True
                 except Exception as e:
                     # BUSYGROUP means it already exists
-                    if "BUSYGROUP" not in str(e):
+                    if "BUSYGROUP" in str(e):
+                        self._group_ready = True
+                    else:
                         logging.debug(f"xgroup_create error (safe to ignore if exists): {e}")
             except Exception as e:
                 logging.debug(f"Ensure group failed: {e}")
@@ -75,7 +106,8 @@ class RedisSignalQueue:
     async def read_new(self, count: int = 64, block_ms: int = 50) -> List[Tuple[str, SignalData]]:
         """Read new messages for this consumer group.
 
-        Returns list of (msg_id, SignalData). Uses XREADGROUP starting from '>' (new only).
+        Returns list of (msg_id, SignalData). Uses XREADGROUP starting from '>' (new only),
+        blocking up to block_ms for the first entry and returning at most count entries.
         """
         await self._ensure_group()
         try:
@@ -99,15 +131,13 @@ class RedisSignalQueue:
                             rugcheck_score=fields.get("rugcheck_score", "pending"),
                             rugcheck_risks=fields.get("rugcheck_risks", "pending"),
                             rugcheck_lp=fields.get("rugcheck_lp", ""),
+                            signal_id=fields.get("signal_id") or None,
                         )
                         # Optional fields
                         try:
                             signal.quality_score = float(fields.get("quality_score", 0.0) or 0.0)
                         except Exception:
                             pass
-                        sid = fields.get("signal_id")
-                        if sid:
-                            signal.signal_id = sid
                         results.append((msg_id, signal))
                     except Exception as e:
                         logging.error(f"Failed to parse signal from Redis: {e}")
@@ -116,13 +146,27 @@ class RedisSignalQueue:
             logging.error(f"Redis read_new failed: {e}")
             return []
 
-    async def ack(self, msg_id: str) -> None:
+    async def ack_many(self, msg_ids: List[str]) -> None:
+        """Acknowledge a batch of messages with a single XACK."""
+        if not msg_ids:
+            return
         try:
-            await self._redis.xack(self.stream_key, self.consumer_group, msg_id)
-            # Optionally, we can trim delivered messages to limit stream size
+            await self._redis.xack(self.stream_key, self.consumer_group, *msg_ids)
         except Exception as e:
             logging.debug(f"Redis ack failed: {e}")
 
+    async def claim_and_ack(self, to_claim: List[Tuple[str, str]], ack_only: List[str], ttl_sec: int) -> Set[str]:
+        """Claim (msg_id, signal_id) pairs for processing and ack all messages in one round trip.
+
+        Returns the signal ids newly claimed; ids already processed are acked but not returned.
+        """
+        if not to_claim and not ack_only:
+            return set()
+        keys = [self.stream_key] + [f"{IDEM_KEY_PREFIX}{sid}" for _msg_id, sid in to_claim]
+        args = [self.consumer_group, ttl_sec] + [msg_id for msg_id, _sid in to_claim] + list(ack_only)
+        positions = await self._claim_and_ack(keys=keys, args=args)
+        return {to_claim[int(p) - 1][1] for p in positions}
+
     async def cleanup_old_signals(self, max_age_hours: float = 24.0) -> None:
         """Trim messages older than max_age_hours.
 
@@ -141,6 +185,8 @@ class RedisSignalQueue:
 
     async def close(self) -> None:
         """Close underlying Redis connection explicitly to avoid loop-finalizer warnings."""
+        if not self._owns_client:
+            return
         try:
             await self._redis.aclose()
         except Exception:
@@ -1,5 +1,6 @@
 import time
 import logging
+from bisect import bisect_right
 from typing import Optional, Tuple
 from .models import Position, PositionStatus, ExitReason, PortfolioStats, SignalData
 
@@ -10,6 +11,8 @@ class RiskManager:
     def __init__(self, settings):
         self.settings = settings
         self.portfolio_stats = PortfolioStats()
+        # Zone thresholds for bisecting the active trailing zone per tick
+        self._zone_thresholds = tuple(threshold for threshold, _ in settings.trailing_zones)
     
     def calculate_position_size(self, signal: SignalData, account_balance_usd: float) -> float:
         """Calculate position size based on signal quality and risk limits"""
@@ -163,18 +166,8 @@ class RiskManager:
         if position.is_derisked and position.remaining_tokens > 0:
             # Respect cooldown between partials
             if time.time() - position.last_partial_sell_time >= self.settings.partial_sell_cooldown_sec:
-                # Parse tiers from config once per call (strings like "5:0.10,8:0.10")
-                try:
-                    tiers = []
-                    for item in self.settings.profit_tiers_csv.split(','):
-                        multiple_str, pct_str = item.split(':')
-                        tiers.append((float(multiple_str), float(pct_str)))
-                    tiers.sort(key=lambda x: x[0])
-                except Exception:
-                    tiers = []
-
-                # Find next tier not yet hit
-                for multiple, sell_pct in tiers:
+                # Find next tier not yet hit (tiers are pre-parsed and sorted)
+                for multiple, sell_pct in self.settings.profit_tiers:
                     multiple_int = int(multiple)
                     if multiple_int not in position.tiers_hit and current_multiple >= multiple:
                         # Ensure we keep a minimum runner balance
@@ -199,17 +192,10 @@ class RiskManager:
 
             # Determine trailing pct from zones
             trail_pct = self.settings.runner_trailing_stop_pct
-            try:
-                zones = []
-                for item in self.settings.trailing_zones_csv.split(','):
-                    mul_str, pct_str = item.split(':')
-                    zones.append((float(mul_str), float(pct_str)))
-                zones.sort(key=lambda x: x[0])
-                for threshold, pct in zones:
-                    if current_multiple >= threshold:
-                        trail_pct = pct
-            except Exception:
-                pass
+            # Highest zone whose threshold has been reached
+            zone = bisect_right(self._zone_thresholds, current_multiple) - 1
+            if zone >= 0:
+                trail_pct = self.settings.trailing_zones[zone][1]
 
             trailing_stop_price = position.runner_peak_price * (1 - trail_pct)
             final_stop_price = max(trailing_stop_price, position.entry_price)
@@ -111,6 +111,14 @@ def main():
     if not validate_environment():
         return 1
     
+    # Optional faster event loop on POSIX
+    if os.name != "nt":
+        try:
+            import uvloop
+            uvloop.install()
+        except ImportError:
+            pass
+    
     # Run executor
     try:
         exit_code = asyncio.run(run_executor())
@@ -11,6 +11,9 @@ from solders.rpc.requests import SendVersionedTransaction
 from solders.rpc.responses import SendTransactionResp
 import aiohttp
 
+# getSignatureStatuses accepts up to 256 signatures per call
+_STATUS_BATCH_MAX = 256
+
 
 class SolanaWallet:
     """High-performance Solana wallet for memecoin execution"""
@@ -38,6 +41,9 @@ class SolanaWallet:
         self.session: Optional[aiohttp.ClientSession] = None
         self._nonce_cache: Optional[int] = None
         self._nonce_last_update = 0.0
+        # Pending confirmations: signature -> future resolved by the shared status poller
+        self._confirm_waiters: Dict[str, asyncio.Future] = {}
+        self._confirm_poller: Optional[asyncio.Task] = None
     
     async def _get_session(self) -> aiohttp.ClientSession:
         """Get or create HTTP session"""
@@ -54,6 +60,8 @@ class SolanaWallet:
     
     async def close(self):
         """Clean shutdown"""
+        if self._confirm_poller and not self._confirm_poller.done():
+            self._confirm_poller.cancel()
         if self.session and not self.session.closed:
             await self.session.close()
     
@@ -191,36 +199,57 @@ class SolanaWallet:
         timeout_seconds: float = 60.0,
         commitment: str = "confirmed"
     ) -> bool:
-        """Wait for transaction confirmation"""
+        """Wait for transaction confirmation
+
+        Outstanding signatures are checked together by a single poller, one
+        getSignatureStatuses call per round for up to 256 signatures.
+        """
         
-        import time
-        start_time = time.time()
+        waiter = self._confirm_waiters.get(signature)
+        if waiter is None:
+            waiter = asyncio.get_running_loop().create_future()
+            self._confirm_waiters[signature] = waiter
+        if self._confirm_poller is None or self._confirm_poller.done():
+            self._confirm_poller = asyncio.create_task(self._poll_signature_statuses())
         
-        while time.time() - start_time < timeout_seconds:
-            try:
-                # getSignatureStatuses expects [ [signatures], config? ]
-                params = [[signature]]
-                result = await self._rpc_call("getSignatureStatuses", params)
-                
-                if result and result.get('value'):
-                    status_info = result['value'][0]
-                    if status_info:
-                        if status_info.get('confirmationStatus') in ['confirmed', 'finalized']:
-                            if status_info.get('err') is None:
-                                logging.info(f"✅ Transaction confirmed: {signature}")
-                                return True
-                            else:
-                                logging.error(f"❌ Transaction failed: {status_info['err']}")
-                                return False
-                
-                await asyncio.sleep(2.0)  # Check every 2 seconds
-                
-            except Exception as e:
-                logging.error(f"Confirmation check error: {e}")
-                await asyncio.sleep(2.0)
+        try:
+            return await asyncio.wait_for(asyncio.shield(waiter), timeout_seconds)
+        except asyncio.TimeoutError:
+            logging.warning(f"⏰ Transaction confirmation timeout: {signature}")
+            return False
+        finally:
+            if self._confirm_waiters.get(signature) is waiter:
+                del self._confirm_waiters[signature]
+    
+    async def _poll_signature_statuses(self) -> None:
+        """Resolve confirmation waiters until none are outstanding"""
         
-        logging.warning(f"⏰ Transaction confirmation timeout: {signature}")
-        return False
+        while self._confirm_waiters:
+            signatures = list(self._confirm_waiters)
+            for i in range(0, len(signatures), _STATUS_BATCH_MAX):
+                chunk = signatures[i:i + _STATUS_BATCH_MAX]
+                try:
+                    # getSignatureStatuses expects [ [signatures], config? ]
+                    result = await self._rpc_call("getSignatureStatuses", [chunk])
+                except Exception as e:
+                    logging.error(f"Confirmation check error: {e}")
+                    continue
+                
+                statuses = (result or {}).get('value') or []
+                for signature, status_info in zip(chunk, statuses):
+                    if not status_info or status_info.get('confirmationStatus') not in ('confirmed', 'finalized'):
+                        continue
+                    waiter = self._confirm_waiters.pop(signature, None)
+                    if waiter is None or waiter.done():
+                        continue
+                    if status_info.get('err') is None:
+                        logging.info(f"✅ Transaction confirmed: {signature}")
+                        waiter.set_result(True)
+                    else:
+                        logging.error(f"❌ Transaction failed: {status_info['err']}")
+                        waiter.set_result(False)
+            
+            await asyncio.sleep(2.0)  # Check every 2 seconds
     
     async def get_token_balance(self, mint_address: str) -> Optional[float]:
         """Get token balance for specific mint"""